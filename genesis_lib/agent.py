@@ -34,7 +34,7 @@ import rti.connextdds as dds
 import rti.rpc as rpc
 from .genesis_app import GenesisApp
 from .llm import ChatAgent, AnthropicChatAgent
-from .utils import get_datamodel_path
+from .utils import get_type_provider, get_type, new_event_loop
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -71,12 +71,11 @@ class GenesisAgent(ABC):
         logger.info(f"GenesisAgent {self.agent_name} initialized with app {self.app.agent_id}")
 
 
-        # Get types from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
+        # Get types from the shared XML provider (parsed and resolved once per process)
+        self.type_provider = get_type_provider()
         # Initialize RPC types
-        self.request_type = self.type_provider.type("genesis_lib", "InterfaceAgentRequest")
-        self.reply_type = self.type_provider.type("genesis_lib", "InterfaceAgentReply")
+        self.request_type = get_type("InterfaceAgentRequest")
+        self.reply_type = get_type("InterfaceAgentReply")
         logger.info(f"GenesisAgent {self.agent_name} initialized with hardcoded InterfaceAgent RPC types")
         # Create event loop for async operations
         self.loop = asyncio.get_event_loop()
@@ -87,11 +86,17 @@ class GenesisAgent(ABC):
         writer_qos = dds.QosProvider.default.datawriter_qos
         writer_qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
         writer_qos.history.kind = dds.HistoryKind.KEEP_LAST
-        writer_qos.history.depth = 500
+        # The agent only ever writes its own instance_id, and late joiners only need its latest announcement
+        writer_qos.history.depth = 1
         writer_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
         writer_qos.liveliness.kind = dds.LivelinessKind.AUTOMATIC
         writer_qos.liveliness.lease_duration = dds.Duration(seconds=2)
         writer_qos.ownership.kind = dds.OwnershipKind.SHARED
+        # Announcements are rare, so heartbeat eagerly; a lost sample is repaired in milliseconds, not seconds
+        reliable_writer = writer_qos.data_writer_protocol.rtps_reliable_writer
+        reliable_writer.heartbeat_period = dds.Duration(seconds=0, nanoseconds=50_000_000)
+        reliable_writer.fast_heartbeat_period = dds.Duration(seconds=0, nanoseconds=10_000_000)
+        reliable_writer.late_joiner_heartbeat_period = dds.Duration(seconds=0, nanoseconds=10_000_000)
 
         # Create registration writer
         self.registration_writer = dds.DynamicData.DataWriter(
@@ -106,6 +111,14 @@ class GenesisAgent(ABC):
             def __init__(self, agent):
                 super().__init__()  # Call parent class __init__
                 self.agent = agent
+                # Replies are filled and sent on the agent loop with no await in between,
+                # so one sample can be reused for every reply
+                self._reply = dds.DynamicData(agent.reply_type)
+                # Request layout is fixed for the agent's lifetime; introspect it once, not per request
+                self._request_members = tuple(
+                    (member.name, member.type.kind == dds.TypeKind.STRING_TYPE)
+                    for member in agent.request_type.members()
+                )
                 
             def on_data_available(self, reader):
                 # Get all available samples
@@ -114,57 +127,47 @@ class GenesisAgent(ABC):
                     if request is None or info.state.instance_state != dds.InstanceState.ALIVE:
                         continue
                         
-                    logger.info(f"Received request: {request}")
+                    logger.info("Received request: %s", request)
                     
                     try:
                         # Create task to process request asynchronously
                         asyncio.run_coroutine_threadsafe(self._process_request(request, info), self.agent.loop)
                     except Exception as e:
-                        logger.error(f"Error creating request processing task: {e}")
-                        logger.error(traceback.format_exc())
+                        logger.exception("Error creating request processing task: %s", e)
                         
             async def _process_request(self, request, info):
                 try:
                     request_dict = {}
-                    if hasattr(self.agent.request_type, 'members') and callable(self.agent.request_type.members):
-                        for member in self.agent.request_type.members():
-                            member_name = member.name
-                            try:
-                                # Check member type and use appropriate getter
-                                # Assuming InterfaceAgentRequest has only string members for now
-                                # A more robust solution would check member.type.kind
-                                if member.type.kind == dds.TypeKind.STRING_TYPE:
-                                    request_dict[member_name] = request.get_string(member_name)
-                                # TODO: Add handling for other types (INT32, BOOLEAN, etc.) if InterfaceAgentRequest evolves
-                                else:
-                                    logger.warning(f"Unsupported member type for '{member_name}' during DDS-to-dict conversion. Attempting direct assignment (may fail).")
-                                    # This part is risky and likely incorrect for non-basic types if not handled properly
-                                    request_dict[member_name] = request[member_name] 
-                            except Exception as e:
-                                logger.warning(f"Could not convert member '{member_name}' from DDS request to dict: {e}")
-                    else:
-                        logger.error("Cannot convert DDS request to dict: self.agent.request_type does not have a members() method. THIS IS A PROBLEM.")
-                        # If we can't determine members, we can't reliably convert.
-                        # Passing the raw request here would be inconsistent with agents expecting a dict.
-                        # It's better to let it fail or send an error reply if conversion is impossible.
-                        raise TypeError("Failed to introspect request_type members for DDS-to-dict conversion.")
+                    for member_name, is_string in self._request_members:
+                        try:
+                            # Assuming InterfaceAgentRequest has only string members for now
+                            if is_string:
+                                request_dict[member_name] = request.get_string(member_name)
+                            # TODO: Add handling for other types (INT32, BOOLEAN, etc.) if InterfaceAgentRequest evolves
+                            else:
+                                logger.warning("Unsupported member type for '%s' during DDS-to-dict conversion. Attempting direct assignment (may fail).", member_name)
+                                # This part is risky and likely incorrect for non-basic types if not handled properly
+                                request_dict[member_name] = request[member_name] 
+                        except Exception as e:
+                            logger.warning("Could not convert member '%s' from DDS request to dict: %s", member_name, e)
 
                     # Get reply data from concrete implementation, passing the dictionary
                     reply_data = await self.agent.process_request(request_dict)
                     
-                    # Create reply
-                    reply = dds.DynamicData(self.agent.reply_type)
+                    # Fill the reusable reply sample
+                    reply = self._reply
+                    reply.clear_all_members()
                     for key, value in reply_data.items():
                         reply[key] = value
                         
                     # Send reply
                     self.agent.replier.send_reply(reply, info)
-                    logger.info(f"Sent reply: {reply}")
+                    logger.info("Sent reply: %s", reply)
                 except Exception as e:
-                    logger.error(f"Error processing request: {e}")
-                    logger.error(traceback.format_exc())
+                    logger.exception("Error processing request: %s", e)
                     # Send error reply
-                    reply = dds.DynamicData(self.agent.reply_type)
+                    reply = self._reply
+                    reply.clear_all_members()
                     reply["status"] = 1  # Error status
                     reply["message"] = f"Error: {str(e)}"
                     self.agent.replier.send_reply(reply, info)
@@ -226,7 +229,7 @@ class GenesisAgent(ABC):
     # Sync version of close for backward compatibility
     def close_sync(self):
         """Synchronous version of close for backward compatibility"""
-        loop = asyncio.new_event_loop()
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             loop.run_until_complete(self.close())
@@ -120,6 +120,41 @@ class SessionEvent:
     timestamp: int  # Unix timestamp in milliseconds
     metadata: str  # JSON string containing event details
 
+@idl.struct(
+    # Registered under the XML type's qualified name so DynamicData endpoints match
+    type_annotations = [idl.type_name("genesis_lib::LogMessage")],
+    member_annotations = {
+        'log_id': [idl.bound(128)],
+        'source_id': [idl.bound(128)],
+        'source_name': [idl.bound(256)],
+        'level_name': [idl.bound(32)],
+        'message': [idl.bound(8192)],
+        'logger_name': [idl.bound(256)],
+        'thread_name': [idl.bound(256)],
+        'file_name': [idl.bound(256)],
+        'function_name': [idl.bound(256)],
+    }
+)
+class LogMessage:
+    """
+    Centralized log record published on the GenesisLogs topic.
+    Mirrors genesis_lib::LogMessage in config/datamodel.xml, name included,
+    so typed and DynamicData endpoints interoperate.
+    """
+    log_id: str = ""  # "<source_id>-<sequence>"
+    timestamp: idl.int64 = 0  # Unix timestamp in milliseconds
+    source_id: str = ""  # Unique identifier of the log source
+    source_name: str = ""  # Human-readable name of the log source
+    level: idl.int32 = 0  # Numeric logging level
+    level_name: str = ""  # Logging level name, e.g. "INFO"
+    message: str = ""  # Log message text
+    logger_name: str = ""  # Name of the emitting logger
+    thread_id: idl.int64 = 0  # ID of the emitting thread
+    thread_name: str = ""  # Name of the emitting thread
+    file_name: str = ""  # Source file of the log call
+    line_number: idl.int32 = 0  # Source line of the log call
+    function_name: str = ""  # Function containing the log call
+
 def validate_schema(schema: Dict[str, Any]) -> bool:
     """
     Validate that a schema follows OpenAI's function schema format.
@@ -40,7 +40,7 @@ import re
 import uuid
 import time
 import os
-from genesis_lib.utils import get_datamodel_path
+from genesis_lib.utils import get_type_provider, get_type, next_event_id
 
 # Monitoring event type constants
 EVENT_TYPE_MAP = {
@@ -150,12 +150,11 @@ class EnhancedServiceBase(GenesisRPCService):
         self.request_type = FunctionRequest
         self.reply_type = FunctionReply
         
-        # Get types from XML for monitoring
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
+        # Get types from the shared XML provider for monitoring
+        self.type_provider = get_type_provider()
         
         # Set up monitoring
-        self.monitoring_type = self.type_provider.type("genesis_lib", "MonitoringEvent")
+        self.monitoring_type = get_type("MonitoringEvent")
         self.monitoring_topic = dds.DynamicData.Topic(
             participant,
             "MonitoringEvent",
@@ -182,9 +181,9 @@ class EnhancedServiceBase(GenesisRPCService):
         
         # Set up enhanced monitoring (V2) - MOVED UP before registry initialization
         # Create topics for new monitoring types
-        self.component_lifecycle_type = self.type_provider.type("genesis_lib", "ComponentLifecycleEvent")
-        self.chain_event_type = self.type_provider.type("genesis_lib", "ChainEvent")
-        self.liveliness_type = self.type_provider.type("genesis_lib", "LivelinessUpdate")
+        self.component_lifecycle_type = get_type("ComponentLifecycleEvent")
+        self.chain_event_type = get_type("ChainEvent")
+        self.liveliness_type = get_type("LivelinessUpdate")
 
         # Create topics
         self.component_lifecycle_topic = dds.DynamicData.Topic(
@@ -390,7 +389,7 @@ class EnhancedServiceBase(GenesisRPCService):
             request_info: Request information containing client ID
         """
         event = dds.DynamicData(self.monitoring_type)
-        event["event_id"] = str(uuid.uuid4())
+        event["event_id"] = next_event_id()
         event["timestamp"] = int(time.time() * 1000)
         
         # Set event type and entity type
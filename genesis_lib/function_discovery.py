@@ -36,9 +36,10 @@ import rti.connextdds as dds
 import rti.rpc as rpc
 import re
 import os
-from genesis_lib.utils import get_datamodel_path
+from genesis_lib.utils import get_type_provider, get_type
 import asyncio
 import sys
+import threading
 import traceback
 
 # Configure root logger to handle all loggers
@@ -52,6 +53,10 @@ import traceback
 
 # Configure function discovery logger specifically
 logger = logging.getLogger("function_discovery")
+
+# FunctionCapability members read from every received advertisement, in unpacking order
+_CAPABILITY_FIELDS = ('function_id', 'name', 'provider_id', 'description',
+                      'parameter_schema', 'capabilities', 'service_name')
 # logger.setLevel(logging.DEBUG) # REMOVE - Let the script control the level
 
 # Set all genesis_lib loggers to DEBUG
@@ -397,6 +402,11 @@ Only include functions that are actually relevant to the request. Do not return
         
         return matches 
 
+def _resolve_discovery_waiter(future: asyncio.Future) -> None:
+    """Complete a wait_for_discovery() future unless it was cancelled or timed out."""
+    if not future.done():
+        future.set_result(None)
+
 class FunctionRegistry:
     """
     Registry for functions that can be called by the agent.
@@ -430,8 +440,12 @@ class FunctionRegistry:
         self.discovered_functions = {}  # Dict[str, Dict] of functions from other providers
         self.service_base = None  # Reference to EnhancedServiceBase
         
-        # Event to signal when the first function capability has been discovered
-        self._discovery_event = asyncio.Event()
+        # Set once the first function capability has been discovered. Each
+        # wait_for_discovery() call parks a future on its own running loop; the
+        # DDS listener thread resolves them through those loops.
+        self._function_discovered = False
+        self._discovery_waiters: List[tuple] = []  # (loop, future) pairs
+        self._discovery_lock = threading.Lock()
         
         # Initialize function matcher with LLM support
         self.matcher = FunctionMatcher()
@@ -447,10 +461,12 @@ class FunctionRegistry:
         # Create publisher (always needed for advertising own functions)
         self.publisher = dds.Publisher(participant)
         
-        # Get types from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
-        self.capability_type = self.type_provider.type("genesis_lib", "FunctionCapability")
+        # Get types from the shared XML provider (parsed once per process)
+        self.type_provider = get_type_provider()
+        self.capability_type = get_type("FunctionCapability")
+        # Resolve the member indices read from every received advertisement once
+        member_names = [member.name for member in self.capability_type.members()]
+        self._capability_field_indices = tuple(member_names.index(name) for name in _CAPABILITY_FIELDS)
         
         # Create topics
         # Try to find the topic first, create if not found
@@ -509,8 +525,8 @@ class FunctionRegistry:
             self.subscriber = dds.Subscriber(participant)
             
             # Get types for execution (only if discovery is enabled)
-            self.execution_request_type = self.type_provider.type("genesis_lib", "FunctionExecutionRequest")
-            self.execution_reply_type = self.type_provider.type("genesis_lib", "FunctionExecutionReply")
+            self.execution_request_type = get_type("FunctionExecutionRequest")
+            self.execution_reply_type = get_type("FunctionExecutionReply")
 
             # Create DataReader for capability discovery
             reader_qos = dds.QosProvider.default.datareader_qos
@@ -568,8 +584,8 @@ class FunctionRegistry:
         Returns:
             Function ID of the registered function
         """
-        # Generate function ID
-        function_id = str(uuid.uuid4())
+        # Generate function ID (interned so downstream dict lookups hit by identity)
+        function_id = sys.intern(str(uuid.uuid4()))
         
         # Log start of registration process
         logger.info(f"Starting function registration in FunctionRegistry",
@@ -725,8 +741,10 @@ class FunctionRegistry:
     def handle_capability_advertisement(self, capability: dds.DynamicData, info: dds.SampleInfo):
         """Handle received function capability data"""
         function_id_str = "unknown_id"
+        (id_index, name_index, provider_index, description_index,
+         schema_index, capabilities_index, service_index) = self._capability_field_indices
         try:
-            function_id_str = capability.get_string("function_id") # Get ID for logging early
+            function_id_str = capability.get_string(id_index) # Get ID for logging early
             logger.debug(f"===== DDS TRACE: handle_capability_advertisement received data for function_id: {function_id_str} =====")
 
             # Check if instance state is ALIVE before processing
@@ -735,13 +753,13 @@ class FunctionRegistry:
                 return
             
             # Extract required fields
-            function_id = capability["function_id"]
-            name = capability["name"]
-            provider_id = capability["provider_id"]
-            description = capability.get_string("description") # Use get_string for safety
-            schema_str = capability.get_string("parameter_schema") # Use get_string for safety
-            capabilities_str = capability.get_string("capabilities") # Use get_string for safety
-            service_name = capability.get_string("service_name") # Get service name
+            function_id = sys.intern(function_id_str)
+            name = capability.get_string(name_index)
+            provider_id = capability.get_string(provider_index)
+            description = capability.get_string(description_index)
+            schema_str = capability.get_string(schema_index)
+            capabilities_str = capability.get_string(capabilities_index)
+            service_name = capability.get_string(service_index) # Get service name
             
             # Basic validation
             if not all([function_id, name, provider_id]):
@@ -767,12 +785,12 @@ class FunctionRegistry:
             logger.info(f"Updated/Added discovered function: {name} ({function_id}) from provider {provider_id} for service {service_name}")
             
             # Signal that at least one function has been discovered
-            if not self._discovery_event.is_set():
-                logger.debug(f"===== DDS TRACE: Setting _discovery_event for function_id: {function_id} =====")
-                self._discovery_event.set()
-                logger.debug("===== DDS TRACE: Discovery event set (first function discovered). =====")
+            if not self._function_discovered:
+                logger.debug(f"===== DDS TRACE: Signalling discovery waiters for function_id: {function_id} =====")
+                self._notify_discovery_waiters()
+                logger.debug("===== DDS TRACE: Discovery waiters signalled (first function discovered). =====")
             else:
-                logger.debug(f"===== DDS TRACE: _discovery_event already set (function_id: {function_id}). =====")
+                logger.debug(f"===== DDS TRACE: Discovery already signalled (function_id: {function_id}). =====")
 
         except KeyError as e:
             logger.error(f"===== DDS TRACE: Missing key in capability data (function_id: {function_id_str}): {e} ====")
@@ -838,6 +856,46 @@ class FunctionRegistry:
             return self.functions.get(function_id)
         return None
     
+    def _notify_discovery_waiters(self) -> None:
+        """Mark discovery as done and wake every waiter on its own loop."""
+        with self._discovery_lock:
+            # A waiter that arrives after this point sees the flag instead
+            self._function_discovered = True
+            waiters, self._discovery_waiters = self._discovery_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_discovery_waiter, future)
+            except RuntimeError:
+                # The waiter's loop has already been closed
+                pass
+
+    async def wait_for_discovery(self, timeout_seconds: Optional[float] = None) -> None:
+        """
+        Wait until the first function capability has been discovered.
+
+        Safe to call from any event loop; each call waits on a future bound
+        to the loop it runs on.
+
+        Args:
+            timeout_seconds: Maximum time to wait, or None to wait indefinitely
+
+        Raises:
+            asyncio.TimeoutError: If nothing is discovered within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        with self._discovery_lock:
+            if self._function_discovered:
+                return
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._discovery_waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout=timeout_seconds)
+        finally:
+            with self._discovery_lock:
+                if waiter in self._discovery_waiters:
+                    self._discovery_waiters.remove(waiter)
+
     def get_all_discovered_functions(self) -> Dict[str, Dict[str, Any]]:
         """
         Returns a shallow copy of the currently discovered functions on the network.
@@ -952,7 +1010,7 @@ class FunctionCapabilityListener(dds.DynamicData.NoOpDataReaderListener):
 
     def on_subscription_matched(self, reader, info):
         """Handle subscription matches"""
-        logger.debug(f"Capability subscription matched: {info.current_count} total writers")
+        logger.debug("Capability subscription matched: %d total writers", info.current_count)
         # Optionally, trigger an initial check or event if needed
         # maybe set the discovery event here if count > 0?
         # if info.current_count > 0 and not self.registry._discovery_event.is_set():
@@ -963,19 +1021,21 @@ class FunctionCapabilityListener(dds.DynamicData.NoOpDataReaderListener):
         """Handle incoming capability data"""
         logger.debug("===== DDS TRACE: FunctionCapabilityListener.on_data_available entered =====")
         try:
-            samples = reader.read() # Take all available samples
-            logger.debug(f"===== DDS TRACE: Read {len(samples)} FunctionCapability samples =====")
-            # Print sample details for debugging
-            for sample, info in samples:
-                logger.debug("===== DDS TRACE: Sample details =====")
-                logger.debug(f"Sample data: {sample}")
-                logger.debug(f"Sample info: {info}")
-                logger.debug(f"Sample state: {info.state.sample_state}")
-                logger.debug(f"Instance state: {info.state.instance_state}")
-                logger.debug("===== DDS TRACE: End sample details =====")
+            # Take all available samples so earlier ones are not re-scanned on every callback
+            samples = reader.take()
+            logger.debug("===== DDS TRACE: Took %d FunctionCapability samples =====", len(samples))
+            # Print sample details for debugging; formatting whole samples is costly on the listener thread
+            if logger.isEnabledFor(logging.DEBUG):
+                for sample, info in samples:
+                    logger.debug("===== DDS TRACE: Sample details =====")
+                    logger.debug("Sample data: %s", sample)
+                    logger.debug("Sample info: %s", info)
+                    logger.debug("Sample state: %s", info.state.sample_state)
+                    logger.debug("Instance state: %s", info.state.instance_state)
+                    logger.debug("===== DDS TRACE: End sample details =====")
             for capability_data, info in samples:
-                # Check if the sample contains valid data that hasn't been read before
-                if info.state.sample_state == dds.SampleState.NOT_READ: # FIX: Check for NOT_READ
+                # Taken samples are always new; only those carrying data are advertisements
+                if info.valid:
                     # This sample contains valid data for a new or updated function
                     log_fid = "N/A"
                     if capability_data:
@@ -983,9 +1043,9 @@ class FunctionCapabilityListener(dds.DynamicData.NoOpDataReaderListener):
                              log_fid = capability_data.get_string("function_id") or "ID_NOT_IN_DATA"
                         except Exception:
                              log_fid = "ERROR_GETTING_ID"
-                    logger.debug(f"===== DDS TRACE: Processing READ sample - FuncID: {log_fid} =====")
+                    logger.debug("===== DDS TRACE: Processing READ sample - FuncID: %s =====", log_fid)
                     # Re-log state for this specific case
-                    logger.debug(f"===== DDS TRACE:   SampleState: {str(info.state.sample_state)}, InstanceState: {str(info.state.instance_state)} =====")
+                    logger.debug("===== DDS TRACE:   SampleState: %s, InstanceState: %s =====", info.state.sample_state, info.state.instance_state)
 
                     # Process the valid data
                     self.registry.handle_capability_advertisement(capability_data, info)
@@ -1002,9 +1062,9 @@ class FunctionCapabilityListener(dds.DynamicData.NoOpDataReaderListener):
                     except Exception:
                         log_fid = "ERROR_GETTING_ID"
 
-                    logger.debug(f"===== DDS TRACE: Processing Non-ALIVE sample - FuncID: {log_fid} =====")
+                    logger.debug("===== DDS TRACE: Processing Non-ALIVE sample - FuncID: %s =====", log_fid)
                     # Re-log state for this specific case
-                    logger.debug(f"===== DDS TRACE:   SampleState: {str(info.state.sample_state)}, InstanceState: {str(info.state.instance_state)} =====")
+                    logger.debug("===== DDS TRACE:   SampleState: %s, InstanceState: %s =====", info.state.sample_state, info.state.instance_state)
 
                     # Process the removal
                     try:
@@ -1013,7 +1073,7 @@ class FunctionCapabilityListener(dds.DynamicData.NoOpDataReaderListener):
                         function_id_to_remove = log_fid if log_fid not in ["N/A", "ID_NOT_IN_DATA", "ERROR_GETTING_ID"] else None
 
                         if function_id_to_remove:
-                            logger.debug(f"===== DDS TRACE: Instance for function ID {function_id_to_remove} no longer alive (state: {info.state.instance_state}). Attempting removal from registry. =====")
+                            logger.debug("===== DDS TRACE: Instance for function ID %s no longer alive (state: %s). Attempting removal from registry. =====", function_id_to_remove, info.state.instance_state)
                             # Check if already removed to avoid redundant logging
                             if function_id_to_remove in self.registry.discovered_functions:
                                 self.registry.remove_discovered_function(function_id_to_remove)
@@ -1023,17 +1083,15 @@ class FunctionCapabilityListener(dds.DynamicData.NoOpDataReaderListener):
                             # This case should be rare if function_id is indeed the key
                             logger.warning(f"===== DDS TRACE: Could not retrieve function_id (key) for disposed/unregistered instance handle {info.instance_handle}. Cannot remove. =====")
                     except dds.Error as e: # Catch specific DDS errors
-                        logger.error(f"===== DDS TRACE: DDS Error getting key for disposed/unregistered instance handle {info.instance_handle}: {e} =====")
+                        logger.error("===== DDS TRACE: DDS Error getting key for disposed/unregistered instance handle %s: %s =====", info.instance_handle, e)
                     except Exception as e: # Catch other unexpected errors
-                        logger.error(f"===== DDS TRACE: Unexpected error getting key/removing for instance handle {info.instance_handle}: {e} =====")
+                        logger.error("===== DDS TRACE: Unexpected error getting key/removing for instance handle %s: %s =====", info.instance_handle, e)
                 # else:
                     # Potentially other states, e.g. sample_state != READ and instance_state == ALIVE.
                     # logger.debug(f"===== DDS TRACE: Ignoring sample with info.state.sample_state={info.state.sample_state} and info.instance_state={info.instance_state} =====")
 
             logger.debug("===== DDS TRACE: Finished processing FunctionCapability samples in on_data_available =====")
         except dds.Error as e: # Catch DDS errors from reader.take()
-            logger.error(f"DDS Error in on_data_available (e.g., during take()): {e}")
-            logger.error(logging.traceback.format_exc())
+            logger.exception("DDS Error in on_data_available (e.g., during take()): %s", e)
         except Exception as e: # Catch other unexpected errors
-            logger.error(f"Unexpected error in on_data_available: {e}")
-            logger.error(logging.traceback.format_exc())
\ No newline at end of file
+            logger.exception("Unexpected error in on_data_available: %s", e)
\ No newline at end of file
@@ -18,6 +18,7 @@ The module provides useful abstractions for:
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import re
+import sys
 
 @dataclass
 class SuccessPattern:
@@ -54,6 +55,7 @@ class FunctionPatternRegistry:
             success_patterns: List of patterns indicating successful execution
             failure_patterns: List of patterns indicating failures
         """
+        function_id = sys.intern(function_id)
         if success_patterns:
             self.success_patterns[function_id] = success_patterns
         if failure_patterns:
@@ -87,10 +87,8 @@ class GenericFunctionClient:
 
         try:
             # Wait for the registry's discovery event or timeout
-            registry_event = self.function_registry._discovery_event
-            logger.debug(f"===== DDS TRACE: Waiting on event {id(registry_event)}... =====")
-            await asyncio.wait_for(registry_event.wait(), timeout=timeout_seconds)
-            logger.debug(f"===== DDS TRACE: Function discovery event received or already set (event: {id(registry_event)}). =====")
+            await self.function_registry.wait_for_discovery(timeout_seconds)
+            logger.debug("===== DDS TRACE: Function discovery event received or already set. =====")
         except asyncio.TimeoutError:
             logger.warning(f"===== DDS TRACE: Timeout ({timeout_seconds}s) reached waiting for function discovery event. =====")
         except Exception as e:
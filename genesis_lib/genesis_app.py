@@ -26,6 +26,7 @@ Copyright (c) 2025, RTI & Jason Upchurch
 #!/usr/bin/env python3
 
 import logging
+import sys
 import time
 from typing import Dict, List, Any, Optional, Callable
 import uuid
@@ -34,8 +35,9 @@ from genesis_lib.function_discovery import FunctionRegistry, FunctionInfo
 from .function_patterns import SuccessPattern, FailurePattern, pattern_registry
 import os
 import traceback
-from genesis_lib.utils import get_datamodel_path
+from genesis_lib.utils import get_type_provider, get_type, new_event_loop
 import asyncio
+from functools import cached_property
 
 # Configure logging
 logger = logging.getLogger("genesis_app")
@@ -70,13 +72,12 @@ class GenesisApp:
         else:
             self.participant = participant
             
-        # Store DDS GUID
-        self.dds_guid = str(self.participant.instance_handle)
+        # Keep the raw DDS instance handle; the string GUID is built on first use
+        self._instance_handle = self.participant.instance_handle
         
-        # Get types from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
-        self.registration_type = self.type_provider.type("genesis_lib", "genesis_agent_registration_announce")
+        # Get types from the shared XML provider (parsed once per process)
+        self.type_provider = get_type_provider()
+        self.registration_type = get_type("genesis_agent_registration_announce")
         
         # Create topics
         self.registration_topic = dds.DynamicData.Topic(
@@ -108,7 +109,7 @@ class GenesisApp:
         # Initialize function registry and pattern registry
         logger.debug("===== DDS TRACE: Initializing FunctionRegistry in GenesisApp =====")
         self.function_registry = FunctionRegistry(self.participant, domain_id)
-        logger.debug(f"===== DDS TRACE: FunctionRegistry initialized with participant {self.participant.instance_handle} =====")
+        logger.debug("===== DDS TRACE: FunctionRegistry initialized with participant %s =====", self._instance_handle)
         self.pattern_registry = pattern_registry
         
         # Register built-in functions
@@ -116,7 +117,12 @@ class GenesisApp:
         self._register_builtin_functions()
         logger.debug("===== DDS TRACE: Completed built-in function registration =====")
         
-        logger.info(f"GenesisApp initialized with agent_id={self.agent_id}, dds_guid={self.dds_guid}")
+        logger.info("GenesisApp initialized with agent_id=%s, dds_guid=%s", self.agent_id, self._instance_handle)
+
+    @cached_property
+    def dds_guid(self) -> str:
+        """String form of the participant's DDS GUID, computed once on first access."""
+        return str(self._instance_handle)
 
     def get_available_functions(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -167,7 +173,7 @@ class GenesisApp:
     # Sync version of close for backward compatibility
     def close_sync(self):
         """Synchronous version of close for backward compatibility"""
-        loop = asyncio.new_event_loop()
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             loop.run_until_complete(self.close())
@@ -191,6 +197,8 @@ class GenesisApp:
         Returns:
             Dictionary containing result or error information
         """
+        # Intern once so the pattern registry lookups below compare by identity
+        function_id = sys.intern(function_id)
         try:
             # Execute the function
             result = super().execute_function(function_id, parameters)
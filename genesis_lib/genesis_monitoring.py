@@ -34,14 +34,16 @@ import logging
 import uuid
 import time
 import threading
+import itertools
 import sys
 import os
-import json
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-import inspect
 import queue
-from genesis_lib.utils import get_datamodel_path
+from collections import defaultdict, deque
+from genesis_lib.utils import get_type_provider, get_type
+from genesis_lib.datamodel import LogMessage
+from genesis_lib.log_buffers import _LogRing, _log_entries, _append_bounded, _select_logs
 
 # Define log level mapping
 LOG_LEVEL_MAP = {
@@ -51,6 +53,42 @@ LOG_LEVEL_MAP = {
     logging.ERROR: "ERROR",
     logging.CRITICAL: "CRITICAL"
 }
+_level_name = LOG_LEVEL_MAP.get
+
+# Used only to render tracebacks attached to log records
+_exception_formatter = logging.Formatter()
+
+# Maximum number of log samples buffered between emit() and the publish worker
+LOG_RING_CAPACITY = 4096
+
+# Ring depth above which DDSLogHandler sheds records below WARNING
+LOG_RING_HIGH_WATERMARK = LOG_RING_CAPACITY * 3 // 4
+
+# Maximum number of log samples handed to a single DataWriter.write() call
+LOG_PUBLISH_BATCH_SIZE = 100
+
+# Idle policy for the publish worker. At zero (the default) it parks as soon as
+# the ring is empty. Raising these makes it poll, then yield the CPU, for that
+# many idle passes before parking: quicker pickup of back-to-back bursts, paid
+# for in CPU on every idle transition.
+LOG_WORKER_SPIN_ITERATIONS = 0
+LOG_WORKER_YIELD_ITERATIONS = 0
+_sched_yield = getattr(os, "sched_yield", None) or (lambda: time.sleep(0))
+
+# Number of LogMessage samples preallocated for reuse by LogPublisher
+LOG_SAMPLE_POOL_SIZE = 256
+
+# DDS history depth for the GenesisLogs writer and reader. Resource limits are
+# pinned to this depth so the (fully bounded) LogMessage samples are
+# preallocated up front and the write/read paths do not allocate.
+LOG_DDS_HISTORY_DEPTH = 1000
+
+# Maximum number of received logs retained by a LogSubscriber
+LOG_HISTORY_SIZE = 10_000
+
+# Maximum number of monitoring events retained by a MonitoringSubscriber
+EVENT_HISTORY_SIZE = 100_000
+
 
 class DDSLogHandler(logging.Handler):
     """
@@ -71,10 +109,11 @@ class DDSLogHandler(logging.Handler):
         self.source_id = source_id or str(uuid.uuid4())
         self.source_name = source_name or f"Source-{self.source_id[:8]}"
         
-        # Set a default formatter
-        self.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
+        # Records below WARNING shed while the publisher is congested
+        self.shed_count = 0
+        
+        # Bypass publish_log's keyword handling; emit has its own error fallback
+        self._write_fn = log_publisher._fill_and_enqueue
     
     def emit(self, record):
         """
@@ -83,41 +122,33 @@ class DDSLogHandler(logging.Handler):
         Args:
             record: The log record to emit
         """
+        # Under congestion drop low-severity records before doing any work
+        if record.levelno < logging.WARNING and self.log_publisher.backlog > LOG_RING_HIGH_WATERMARK:
+            self.shed_count += 1
+            return
+        
         try:
-            # Format the message
-            msg = self.format(record)
+            # Report shed records once the publisher has room again
+            if self.shed_count:
+                shed, self.shed_count = self.shed_count, 0
+                self.log_publisher.publish_log(
+                    level=logging.WARNING,
+                    message=f"Dropped {shed} log records below WARNING while the DDS log queue was congested",
+                    logger_name=__name__
+                )
             
-            # Get caller information
-            frame = inspect.currentframe()
-            if frame:
-                frame = frame.f_back
-                while frame and frame.f_code.co_filename == __file__:
-                    frame = frame.f_back
-                
-                if frame:
-                    file_name = os.path.basename(frame.f_code.co_filename)
-                    line_number = frame.f_lineno
-                    function_name = frame.f_code.co_name
-                else:
-                    file_name = record.filename
-                    line_number = record.lineno
-                    function_name = record.funcName
-            else:
-                file_name = record.filename
-                line_number = record.lineno
-                function_name = record.funcName
+            # Timestamp, level and logger name travel as separate DDS fields,
+            # so only the message text (plus any traceback) is sent
+            msg = record.getMessage()
+            if record.exc_info:
+                msg = f"{msg}\n{_exception_formatter.formatException(record.exc_info)}"
             
             # Publish the log message
-            self.log_publisher.publish_log(
-                level=record.levelno,
-                message=msg,
-                logger_name=record.name,
-                thread_id=str(record.thread),
-                thread_name=record.threadName,
-                file_name=file_name,
-                line_number=line_number,
-                function_name=function_name
-            )
+            # Hand-built records may carry None for the caller fields, which the
+            # typed str members reject
+            self._write_fn(record.levelno, msg, record.name, record.thread or 0,
+                           record.threadName or "", record.filename or "", record.lineno or 0,
+                           record.funcName or "")
         except Exception as e:
             # Fallback to stderr if DDS publishing fails
             sys.stderr.write(f"Error in DDSLogHandler: {e}\n")
@@ -142,6 +173,10 @@ class LogPublisher:
         self.source_id = source_id or str(uuid.uuid4())
         self.source_name = source_name or f"Source-{self.source_id[:8]}"
         
+        # Log IDs are "<source_id>-<sequence>"; unique without a uuid per record
+        self._log_id_prefix = self.source_id + "-"
+        self._next_seq = itertools.count().__next__
+        
         # Create or use provided participant
         self.owns_participant = participant is None
         if self.owns_participant:
@@ -150,13 +185,11 @@ class LogPublisher:
         else:
             self.participant = participant
         
-        # Get log message type from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
-        self.log_type = self.type_provider.type("genesis_lib", "LogMessage")
+        # Log messages use the typed IDL struct rather than DynamicData
+        self.log_type = LogMessage
         
         # Create log topic
-        self.log_topic = dds.DynamicData.Topic(
+        self.log_topic = dds.Topic(
             self.participant,
             "GenesisLogs",
             self.log_type
@@ -173,41 +206,75 @@ class LogPublisher:
         writer_qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
         writer_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
         writer_qos.history.kind = dds.HistoryKind.KEEP_LAST
-        writer_qos.history.depth = 1000  # Keep more history for logs
+        writer_qos.history.depth = LOG_DDS_HISTORY_DEPTH  # Keep more history for logs
+        writer_qos.resource_limits.max_samples = LOG_DDS_HISTORY_DEPTH
+        writer_qos.resource_limits.max_samples_per_instance = LOG_DDS_HISTORY_DEPTH
+        writer_qos.resource_limits.initial_samples = LOG_DDS_HISTORY_DEPTH
         
         # Create log writer
-        self.log_writer = dds.DynamicData.DataWriter(
+        self.log_writer = dds.DataWriter(
             self.publisher,
             self.log_topic,
             qos=writer_qos
         )
         
-        # Create a queue for asynchronous log publishing to avoid deadlocks
-        self.log_queue = queue.Queue()
+        # Pool of reusable log samples; the worker returns them after write()
+        self._sample_pool = deque(
+            self._new_log_sample() for _ in range(LOG_SAMPLE_POOL_SIZE)
+        )
+        
+        # Bounded ring for asynchronous log publishing to avoid deadlocks
+        self._ring = _LogRing(LOG_RING_CAPACITY)
+        self._closing = False
         self.publish_thread = threading.Thread(target=self._publish_worker, daemon=True)
         self.publish_thread.start()
     
+    @property
+    def backlog(self):
+        """Number of log samples waiting to be written by the publish worker."""
+        return len(self._ring)
+    
+    @property
+    def dropped_count(self):
+        """Number of log records dropped because the publish ring was full."""
+        return self._ring.dropped_count
+    
     def _publish_worker(self):
-        """Worker thread that processes the log queue and publishes messages"""
+        """Worker thread that drains the log ring and publishes messages"""
+        ring = self._ring
+        idle_iterations = 0
         while True:
+            batch = ring.pop_batch(LOG_PUBLISH_BATCH_SIZE)
+            if not batch:
+                if self._closing:
+                    break
+                # Poll before parking only if LOG_WORKER_SPIN/YIELD_ITERATIONS opt in
+                idle_iterations += 1
+                if idle_iterations <= LOG_WORKER_SPIN_ITERATIONS:
+                    continue
+                if idle_iterations <= LOG_WORKER_YIELD_ITERATIONS:
+                    _sched_yield()
+                    continue
+                ring.wait()
+                idle_iterations = 0
+                continue
+            idle_iterations = 0
             try:
-                # Get log data from queue
-                log_data = self.log_queue.get()
-                
-                # Write log message
-                self.log_writer.write(log_data)
-                
-                # Mark task as done
-                self.log_queue.task_done()
+                # Write the whole batch in one call to amortize the DDS write overhead
+                self.log_writer.write(batch)
             except Exception as e:
                 # Fallback to stderr if DDS publishing fails
                 sys.stderr.write(f"Error in log publisher worker: {e}\n")
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.001)
+            # write() copies the samples, so they can be reused immediately
+            self._sample_pool.extend(batch)
+    
+    def _new_log_sample(self):
+        """Allocate a LogMessage sample with the constant source fields already set."""
+        return LogMessage(source_id=self.source_id, source_name=self.source_name)
     
     def publish_log(self, level: int, message: str, logger_name: str = "",
-                   thread_id: str = "", thread_name: str = "",
+                   thread_id: int = 0, thread_name: str = "",
                    file_name: str = "", line_number: int = 0,
                    function_name: str = ""):
         """
@@ -224,33 +291,43 @@ class LogPublisher:
             function_name: Function where the log was generated
         """
         try:
-            # Create log message
-            log_data = dds.DynamicData(self.log_type)
-            log_data["log_id"] = str(uuid.uuid4())
-            log_data["timestamp"] = int(time.time() * 1000)  # milliseconds
-            log_data["source_id"] = self.source_id
-            log_data["source_name"] = self.source_name
-            log_data["level"] = level
-            log_data["level_name"] = LOG_LEVEL_MAP.get(level, "UNKNOWN")
-            log_data["message"] = message
-            log_data["logger_name"] = logger_name
-            log_data["thread_id"] = thread_id
-            log_data["thread_name"] = thread_name
-            log_data["file_name"] = file_name
-            log_data["line_number"] = line_number
-            log_data["function_name"] = function_name
-            
-            # Add to queue for asynchronous publishing
-            self.log_queue.put(log_data)
+            self._fill_and_enqueue(level, message, logger_name, thread_id, thread_name,
+                                   file_name, line_number, function_name)
         except Exception as e:
             # Fallback to stderr if DDS publishing fails
             sys.stderr.write(f"Error publishing log via DDS: {e}\n")
             sys.stderr.write(f"Original log message: {message}\n")
     
+    def _fill_and_enqueue(self, level, message, logger_name, thread_id, thread_name,
+                          file_name, line_number, function_name):
+        """Positional-only fast path behind publish_log; exceptions propagate to the caller."""
+        # Reuse a pooled log message, allocating only when the pool is empty
+        try:
+            log_data = self._sample_pool.popleft()
+        except IndexError:
+            log_data = self._new_log_sample()
+        log_data.log_id = self._log_id_prefix + str(self._next_seq())
+        log_data.timestamp = time.time_ns() // 1_000_000  # milliseconds
+        log_data.level = level
+        log_data.level_name = _level_name(level, "UNKNOWN")
+        log_data.message = message
+        log_data.logger_name = logger_name
+        log_data.thread_id = thread_id
+        log_data.thread_name = thread_name
+        log_data.file_name = file_name
+        log_data.line_number = line_number
+        log_data.function_name = function_name
+        
+        # Add to ring for asynchronous publishing (dropped if full)
+        if not self._ring.try_push(log_data):
+            self._sample_pool.append(log_data)
+    
     def close(self):
         """Clean up DDS resources."""
-        # Wait for queue to be processed
-        self.log_queue.join()
+        # Let the worker drain the ring before tearing down the writer
+        self._closing = True
+        self._ring.wake()
+        self.publish_thread.join(timeout=5.0)
         
         if hasattr(self, 'log_writer'):
             self.log_writer.close()
@@ -267,14 +344,17 @@ class LogSubscriber:
     Subscribes to log messages via DDS to enable centralized monitoring
     of logs from distributed components.
     """
-    def __init__(self, participant=None, domain_id=0, callback=None):
+    def __init__(self, participant=None, domain_id=0, callback=None, threaded_callback=False):
         """
         Initialize the log subscriber.
         
         Args:
             participant: DDS participant to use (creates one if None)
             domain_id: DDS domain ID to use if creating a participant
-            callback: Function to call when a log message is received
+            callback: Function to call with each log dictionary as it is received
+            threaded_callback: If True, run `callback` on a dedicated thread instead
+                of the DDS listener thread. Slow callbacks then no longer hold up
+                reception, but they may run after the log is visible to get_logs()
         """
         self.callback = callback
         
@@ -286,13 +366,11 @@ class LogSubscriber:
         else:
             self.participant = participant
         
-        # Get log message type from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
-        self.log_type = self.type_provider.type("genesis_lib", "LogMessage")
+        # Log messages use the typed IDL struct rather than DynamicData
+        self.log_type = LogMessage
         
         # Create log topic
-        self.log_topic = dds.DynamicData.Topic(
+        self.log_topic = dds.Topic(
             self.participant,
             "GenesisLogs",
             self.log_type
@@ -309,20 +387,33 @@ class LogSubscriber:
         reader_qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
         reader_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
         reader_qos.history.kind = dds.HistoryKind.KEEP_LAST
-        reader_qos.history.depth = 1000  # Keep more history for logs
+        reader_qos.history.depth = LOG_DDS_HISTORY_DEPTH  # Keep more history for logs
+        reader_qos.resource_limits.max_samples = LOG_DDS_HISTORY_DEPTH
+        reader_qos.resource_limits.max_samples_per_instance = LOG_DDS_HISTORY_DEPTH
+        reader_qos.resource_limits.initial_samples = LOG_DDS_HISTORY_DEPTH
+        
+        # Store received log dictionaries, keeping the newest LOG_HISTORY_SIZE.
+        # logs stays a plain list guarded by logs_lock, so callers that slice it
+        # or lock around it keep working; the oldest entries are trimmed as
+        # batches arrive.
+        self.logs = []
+        self.logs_lock = threading.Lock()
+        
+        # Optionally dispatch the user callback off the DDS listener thread
+        self._callback_queue = None
+        if self.callback and threaded_callback:
+            self._callback_queue = queue.Queue()
+            self._callback_thread = threading.Thread(target=self._callback_worker, daemon=True)
+            self._callback_thread.start()
         
         # Create log reader with listener
-        self.listener = LogListener(self._on_log_received)
-        self.log_reader = dds.DynamicData.DataReader(
+        self.listener = LogListener(self._on_log_received, batch_callback=self._on_log_batch_received)
+        self.log_reader = dds.DataReader(
             self.subscriber,
             self.log_topic,
             qos=reader_qos,
             listener=self.listener
         )
-        
-        # Store received logs
-        self.logs = []
-        self.logs_lock = threading.Lock()
     
     def _on_log_received(self, log_data):
         """
@@ -331,30 +422,40 @@ class LogSubscriber:
         Args:
             log_data: The received log message data
         """
+        self._on_log_batch_received([log_data])
+    
+    def _on_log_batch_received(self, samples):
+        """
+        Handle a batch of received log messages under a single lock acquisition.
+        
+        Args:
+            samples: List of received log message data
+        """
+        entries = _log_entries(samples)
         with self.logs_lock:
-            # Convert to dictionary for easier handling
-            log_dict = {
-                "log_id": log_data["log_id"],
-                "timestamp": log_data["timestamp"],
-                "source_id": log_data["source_id"],
-                "source_name": log_data["source_name"],
-                "level": log_data["level"],
-                "level_name": log_data["level_name"],
-                "message": log_data["message"],
-                "logger_name": log_data["logger_name"],
-                "thread_id": log_data["thread_id"],
-                "thread_name": log_data["thread_name"],
-                "file_name": log_data["file_name"],
-                "line_number": log_data["line_number"],
-                "function_name": log_data["function_name"]
-            }
-            
-            # Add to logs list
-            self.logs.append(log_dict)
-            
-            # Call callback if provided
-            if self.callback:
-                self.callback(log_dict)
+            _append_bounded(self.logs, entries, LOG_HISTORY_SIZE)
+        
+        if self._callback_queue is not None:
+            for entry in entries:
+                self._callback_queue.put(entry)
+        elif self.callback:
+            for entry in entries:
+                self._run_callback(entry)
+    
+    def _run_callback(self, log_dict):
+        """Invoke the user callback, reporting rather than propagating its errors"""
+        try:
+            self.callback(log_dict)
+        except Exception as e:
+            sys.stderr.write(f"Error in log callback: {e}\n")
+    
+    def _callback_worker(self):
+        """Worker thread that invokes the user callback when threaded_callback is set"""
+        while True:
+            entry = self._callback_queue.get()
+            if entry is None:
+                break
+            self._run_callback(entry)
     
     def get_logs(self, max_count=None, level_filter=None, source_filter=None):
         """
@@ -368,25 +469,16 @@ class LogSubscriber:
         Returns:
             List of log dictionaries
         """
+        if level_filter is None and source_filter is None:
+            # No filters: copy just the newest max_count entries
+            with self.logs_lock:
+                return self.logs[-max_count:] if max_count else self.logs[:]
+        
+        # Snapshot under the lock, then filter without blocking the listener
         with self.logs_lock:
-            filtered_logs = self.logs
-            
-            # Apply level filter
-            if level_filter is not None:
-                filtered_logs = [log for log in filtered_logs if log["level"] >= level_filter]
-            
-            # Apply source filter
-            if source_filter is not None:
-                filtered_logs = [
-                    log for log in filtered_logs 
-                    if source_filter in (log["source_id"], log["source_name"])
-                ]
-            
-            # Apply count limit
-            if max_count is not None:
-                filtered_logs = filtered_logs[-max_count:]
-            
-            return filtered_logs
+            snapshot = self.logs[:]
+        
+        return _select_logs(snapshot, max_count, level_filter, source_filter)
     
     def clear_logs(self):
         """Clear the stored logs."""
@@ -397,6 +489,8 @@ class LogSubscriber:
         """Clean up DDS resources."""
         if hasattr(self, 'log_reader'):
             self.log_reader.close()
+        if self._callback_queue is not None:
+            self._callback_queue.put(None)
         if hasattr(self, 'subscriber'):
             self.subscriber.close()
         if hasattr(self, 'log_topic'):
@@ -405,23 +499,36 @@ class LogSubscriber:
             self.participant.close()
 
 
-class LogListener(dds.DynamicData.NoOpDataReaderListener):
+class LogListener(dds.NoOpDataReaderListener):
     """Listener for log messages."""
-    def __init__(self, callback):
+    def __init__(self, callback, batch_callback=None):
+        """
+        Args:
+            callback: Called with each valid log sample
+            batch_callback: If provided, called once per take() with the list of
+                valid samples instead of calling `callback` per sample
+        """
         super().__init__()
         self.callback = callback
+        self.batch_callback = batch_callback
     
     def on_data_available(self, reader):
         """Handle data available event."""
         try:
-            # Read all available samples
-            samples = reader.take()
-            for data, info in samples:
-                if data is None or info.state.instance_state != dds.InstanceState.ALIVE:
-                    continue
-                
-                # Call callback with log data
-                self.callback(data)
+            # Take all available samples, keeping only live data
+            alive = dds.InstanceState.ALIVE
+            batch = [
+                data for data, info in reader.take()
+                if data is not None and info.state.instance_state == alive
+            ]
+            if not batch:
+                return
+            
+            if self.batch_callback is not None:
+                self.batch_callback(batch)
+            else:
+                for data in batch:
+                    self.callback(data)
         except Exception as e:
             sys.stderr.write(f"Error in LogListener: {e}\n")
 
@@ -450,10 +557,9 @@ class MonitoringSubscriber:
         else:
             self.participant = participant
         
-        # Get monitoring event type from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
-        self.event_type = self.type_provider.type("genesis_lib", "MonitoringEvent")
+        # Get monitoring event type from the shared XML type provider
+        self.type_provider = get_type_provider()
+        self.event_type = get_type("MonitoringEvent")
         
         # Create monitoring topic
         self.event_topic = dds.DynamicData.Topic(
@@ -475,6 +581,15 @@ class MonitoringSubscriber:
         reader_qos.history.kind = dds.HistoryKind.KEEP_LAST
         reader_qos.history.depth = 1000  # Keep more history for events
         
+        # Store events for querying, indexed by event and entity type. Index
+        # buckets hold (sequence, event) pairs and are trimmed to the events
+        # still in self.events, so filtered and unfiltered queries agree.
+        self.events = deque(maxlen=EVENT_HISTORY_SIZE)
+        self._by_event_type = defaultdict(deque)
+        self._by_entity_type = defaultdict(deque)
+        self._received_count = 0
+        self.events_lock = threading.Lock()
+        
         # Create event reader with listener
         self.event_reader = dds.DynamicData.DataReader(
             self.subscriber,
@@ -482,10 +597,6 @@ class MonitoringSubscriber:
             qos=reader_qos,
             listener=MonitoringListener(self._on_event_received)
         )
-        
-        # Store events for querying
-        self.events = []
-        self.events_lock = threading.Lock()
     
     def _on_event_received(self, event_data):
         """Process received monitoring event."""
@@ -503,9 +614,15 @@ class MonitoringSubscriber:
                 "status_data": event_data["status_data"]
             }
             
-            # Store event
+            # Store event and index it
             with self.events_lock:
+                entry = (self._received_count, event)
+                self._received_count += 1
                 self.events.append(event)
+                for index, key in ((self._by_event_type, event["event_type"]),
+                                   (self._by_entity_type, event["entity_type"])):
+                    index[key].append(entry)
+                    self._trimmed_bucket(index, key)
             
             # Call callback if provided
             if self.callback:
@@ -526,23 +643,47 @@ class MonitoringSubscriber:
             List of events matching the filters
         """
         with self.events_lock:
-            filtered = self.events
-            
-            if event_type:
-                filtered = [e for e in filtered if e["event_type"] == event_type]
-            
-            if entity_type:
-                filtered = [e for e in filtered if e["entity_type"] == entity_type]
-            
-            if max_count:
-                filtered = filtered[-max_count:]
-            
-            return filtered
+            # Start from the smallest index bucket that satisfies the filters
+            if event_type and entity_type:
+                by_event = self._trimmed_bucket(self._by_event_type, event_type)
+                by_entity = self._trimmed_bucket(self._by_entity_type, entity_type)
+                if len(by_event) <= len(by_entity):
+                    filtered = [e for _, e in by_event if e["entity_type"] == entity_type]
+                else:
+                    filtered = [e for _, e in by_entity if e["event_type"] == event_type]
+            elif event_type:
+                filtered = [e for _, e in self._trimmed_bucket(self._by_event_type, event_type)]
+            elif entity_type:
+                filtered = [e for _, e in self._trimmed_bucket(self._by_entity_type, entity_type)]
+            else:
+                filtered = list(self.events)
+        
+        if max_count:
+            filtered = filtered[-max_count:]
+        
+        return filtered
     
+    def _trimmed_bucket(self, index, key):
+        """
+        Return an index bucket after dropping the events self.events has evicted.
+
+        Called with events_lock held. Events are appended in sequence order, so
+        the evicted ones are always at the head of the bucket.
+        """
+        bucket = index.get(key)
+        if not bucket:
+            return ()
+        oldest_retained = self._received_count - len(self.events)
+        while bucket and bucket[0][0] < oldest_retained:
+            bucket.popleft()
+        return bucket
+
     def clear_events(self):
         """Clear stored events."""
         with self.events_lock:
-            self.events = []
+            self.events.clear()
+            self._by_event_type.clear()
+            self._by_entity_type.clear()
     
     def close(self):
         """Clean up DDS resources."""
@@ -587,11 +728,36 @@ def configure_dds_logging(logger_name=None, participant=None, domain_id=0,
         
     Returns:
         Tuple of (logger, log_publisher, log_handler)
+    
+    If the logger already has a DDSLogHandler, that handler and its publisher
+    are returned and only `log_level` is applied; a warning is written to
+    stderr if the participant, domain or source arguments differ from theirs.
     """
     # Get the logger
     logger = logging.getLogger(logger_name)
     logger.setLevel(log_level)
     
+    # Reuse a handler from an earlier call; a second one would publish every record twice
+    for existing in logger.handlers:
+        if isinstance(existing, DDSLogHandler):
+            existing.setLevel(log_level)
+            publisher = existing.log_publisher
+            ignored = []
+            if participant is not None and participant is not publisher.participant:
+                ignored.append("participant")
+            elif participant is None and domain_id != publisher.participant.domain_id:
+                ignored.append(f"domain_id={domain_id}")
+            if source_id is not None and source_id != existing.source_id:
+                ignored.append(f"source_id={source_id!r}")
+            if source_name is not None and source_name != existing.source_name:
+                ignored.append(f"source_name={source_name!r}")
+            if ignored:
+                sys.stderr.write(
+                    f"configure_dds_logging: logger {logger.name!r} already publishes to DDS as "
+                    f"{existing.source_name!r}; ignoring {', '.join(ignored)}\n"
+                )
+            return logger, publisher, existing
+    
     # Create log publisher
     log_publisher = LogPublisher(
         participant=participant,
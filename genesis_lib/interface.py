@@ -29,13 +29,71 @@ import rti.rpc as rpc
 from .genesis_app import GenesisApp
 import uuid
 import json
-from genesis_lib.utils import get_datamodel_path
+import functools
+import threading
+import queue
+from genesis_lib.utils import get_type_provider, get_type, new_event_loop, wait_duration, wait_for_replier_match
 import asyncio
-import traceback
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def _interface_agent_types():
+    """
+    Resolve the InterfaceAgent request/reply types once per process.
+
+    Returns:
+        tuple: (request_type, reply_type, reply_members) where reply_members is a
+        tuple of the reply type's member names
+    """
+    request_type = get_type("InterfaceAgentRequest")
+    reply_type = get_type("InterfaceAgentReply")
+    return request_type, reply_type, tuple(member.name for member in reply_type.members())
+
+@functools.lru_cache(maxsize=1)
+def _registration_reader_qos():
+    """
+    Build the registration reader QoS once per process.
+
+    Readers copy the QoS on creation, so the same object is safely shared by every
+    interface.
+
+    Returns:
+        dds.DataReaderQos: QoS for GenesisRegistration readers
+    """
+    reader_qos = dds.QosProvider.default.datareader_qos
+    reader_qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
+    reader_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
+    reader_qos.history.kind = dds.HistoryKind.KEEP_LAST
+    # The topic is keyed on instance_id and only the latest announcement per agent matters
+    reader_qos.history.depth = 1
+    reader_qos.liveliness.kind = dds.LivelinessKind.AUTOMATIC
+    reader_qos.liveliness.lease_duration = dds.Duration(seconds=2)
+    reader_qos.ownership.kind = dds.OwnershipKind.SHARED
+    # ACK/NACK writer heartbeats immediately so lost announcements are repaired without the default delay
+    reliable_reader = reader_qos.data_reader_protocol.rtps_reliable_reader
+    reliable_reader.min_heartbeat_response_delay = dds.Duration(seconds=0)
+    reliable_reader.max_heartbeat_response_delay = dds.Duration(seconds=0)
+    return reader_qos
+
+# Announcements buffered for next_agent_announcement() before the oldest are dropped
+ANNOUNCEMENT_QUEUE_SIZE = 256
+
+# Known agents kept by RegistrationListener before the longest-known are forgotten
+MAX_KNOWN_ANNOUNCEMENTS = 1024
+
+# Announcement members read positionally from registration samples, plus the local receipt time
+_ANNOUNCEMENT_FIELDS = ('message', 'prefered_name', 'default_capable', 'instance_id', 'service_name', 'timestamp')
+
+# Queued ahead of closing a requester: the worker drops it and acknowledges through the paired Event
+_RELEASE_REQUESTER = object()
+
+def _resolve_future(future: asyncio.Future, result):
+    """Set a future's result unless the awaiting caller has already given up on it."""
+    if not future.done():
+        future.set_result(result)
+
 class RegistrationListener(dds.DynamicData.NoOpDataReaderListener):
     """Listener for registration announcements"""
     def __init__(self, 
@@ -46,66 +104,131 @@ class RegistrationListener(dds.DynamicData.NoOpDataReaderListener):
         logger.debug("🔧 TRACE: RegistrationListener class init calling now")
         super().__init__()
         self.interface = interface
-        self.received_announcements = {}  # Track announcements by instance_id
+        # Track announcements (agent info dicts) by instance_id, oldest first
+        self.received_announcements = {}
         self.on_agent_discovered = on_discovered
         self.on_agent_departed = on_departed
         self._loop = loop
+        # Resolve announcement member indices once so samples are read positionally, not by name
+        member_names = [member.name for member in interface.app.registration_type.members()]
+        self._field_indices = tuple(member_names.index(name) for name in _ANNOUNCEMENT_FIELDS[:-1])
+        # Set from the DDS listener thread via the loop, so coroutines can await discovery
+        self.matched_event = asyncio.Event()
+        self.announced_event = asyncio.Event()
+        # New announcements in arrival order; the oldest is dropped once the queue is full
+        self.announcement_queue: asyncio.Queue = asyncio.Queue(maxsize=ANNOUNCEMENT_QUEUE_SIZE)
         logger.debug("🔧 TRACE: Registration listener initialized with callbacks")
         
     def on_data_available(self, reader):
-        """Handle new registration announcements and departures"""
-        logger.debug("🔔 TRACE: RegistrationListener.on_data_available called (sync)")
+        """Take new registration samples and hand them to the event loop"""
+        try:
+            # Take the whole batch so already-processed samples are not re-read on every callback;
+            # everything else happens on the loop so the DDS receive thread is released at once
+            samples = reader.take()
+            if samples:
+                # Dispose/unregister notifications carry no data, and a taken instance may be
+                # reclaimed, so their keys are recovered here rather than on the loop
+                samples = [
+                    (reader.key_value(info.instance_handle), info)
+                    if not info.valid and info.state.instance_state != dds.InstanceState.ALIVE
+                    else (data, info)
+                    for data, info in samples
+                ]
+                self._loop.call_soon_threadsafe(self._process_samples, samples)
+        except dds.Error as dds_e:
+            logger.exception("❌ TRACE: DDS Error in on_data_available: %s", dds_e)
+        except Exception as e:
+            logger.exception("❌ TRACE: Unexpected error taking registration announcements: %s", e)
+
+    def _process_samples(self, samples):
+        """Apply a batch of announcements and departures; runs on the event loop."""
         try:
-            samples = reader.read()
-            logger.debug(f"📦 TRACE: Read {len(samples)} samples from reader")
+            announcements = self.received_announcements
+            message_index, name_index, capable_index, id_index, service_index = self._field_indices
+            discovered = departed = 0
+            new_entries = []
+            # Discoveries (agent info dicts) and departures (instance_id strings) in sample order
+            changes = []
             
             for data, info in samples:
+                instance_state = info.state.instance_state
+                if not info.valid and instance_state == dds.InstanceState.ALIVE:
+                    continue
                 if data is None:
-                    logger.warning(f"⚠️ TRACE: Skipping sample - data is None. Instance Handle: {info.instance_handle if info else 'Unknown'}")
+                    logger.warning("⚠️ TRACE: Skipping sample - data is None. Instance Handle: %s", info.instance_handle if info else 'Unknown')
                     continue
                     
-                instance_id = data.get_string('instance_id')
+                instance_id = data.get_string(id_index)
                 if not instance_id:
-                    logger.warning(f"⚠️ TRACE: Skipping sample - missing instance_id. Data: {data}")
+                    logger.warning("⚠️ TRACE: Skipping sample - missing instance_id. Data: %s", data)
                     continue
 
-                if info.state.instance_state == dds.InstanceState.ALIVE:
-                    if instance_id not in self.received_announcements:
-                        service_name = data.get_string('service_name')
-                        prefered_name = data.get_string('prefered_name')
-                        agent_info = {
-                            'message': data.get_string('message'),
-                            'prefered_name': prefered_name,
-                            'default_capable': data.get_int32('default_capable'),
+                if instance_state == dds.InstanceState.ALIVE:
+                    if instance_id not in announcements:
+                        entry = {
+                            'message': data.get_string(message_index),
+                            'prefered_name': data.get_string(name_index),
+                            'default_capable': data.get_int32(capable_index),
                             'instance_id': instance_id,
-                            'service_name': service_name,
+                            'service_name': data.get_string(service_index),
                             'timestamp': time.time()
                         }
-                        self.received_announcements[instance_id] = agent_info
-                        logger.debug(f"✨ TRACE: Agent DISCOVERED: {prefered_name} ({service_name}) - ID: {instance_id}")
-                        if self.on_agent_discovered:
-                            # Schedule the async task creation onto the main loop thread
-                            self._loop.call_soon_threadsafe(asyncio.create_task, self._run_discovery_callback(agent_info))
-                elif info.state.instance_state in [dds.InstanceState.NOT_ALIVE_DISPOSED, dds.InstanceState.NOT_ALIVE_NO_WRITERS]:
-                    if instance_id in self.received_announcements:
-                        departed_info = self.received_announcements.pop(instance_id)
-                        logger.debug(f"👻 TRACE: Agent DEPARTED: {departed_info.get('prefered_name', 'N/A')} - ID: {instance_id} - Reason: {info.state.instance_state}")
-                        if self.on_agent_departed:
-                            # Schedule the async task creation onto the main loop thread
-                            self._loop.call_soon_threadsafe(asyncio.create_task, self._run_departure_callback(instance_id))
+                        if len(announcements) >= MAX_KNOWN_ANNOUNCEMENTS:
+                            # Agents that vanish without a dispose would otherwise accumulate forever
+                            del announcements[next(iter(announcements))]
+                        announcements[instance_id] = entry
+                        new_entries.append(entry)
+                        changes.append(entry)
+                        discovered += 1
+                elif instance_state in (dds.InstanceState.NOT_ALIVE_DISPOSED, dds.InstanceState.NOT_ALIVE_NO_WRITERS):
+                    if announcements.pop(instance_id, None) is not None:
+                        changes.append(instance_id)
+                        departed += 1
+
+            if changes:
+                self._dispatch_changes(new_entries, changes, not announcements)
+            logger.debug("📦 TRACE: Took %d samples: %d agents discovered, %d departed, %d known",
+                         len(samples), discovered, departed, len(announcements))
         except dds.Error as dds_e:
-            logger.error(f"❌ TRACE: DDS Error in on_data_available: {dds_e}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ TRACE: DDS Error processing registration announcements: %s", dds_e)
         except Exception as e:
-            logger.error(f"❌ TRACE: Unexpected error processing registration announcement: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ TRACE: Unexpected error processing registration announcement: %s", e)
+
+    def _dispatch_changes(self, new_entries, changes, none_known):
+        """Publish one take's announcements and start its callbacks."""
+        if new_entries:
+            self._publish_announcements(new_entries)
+        elif none_known:
+            self.announced_event.clear()
+        if self.on_agent_discovered or self.on_agent_departed:
+            asyncio.create_task(self._run_callbacks(changes))
+
+    def _publish_announcements(self, entries):
+        """Queue a batch of new announcements and signal waiters; runs on the event loop."""
+        queue_ = self.announcement_queue
+        for entry in entries:
+            if queue_.full():
+                queue_.get_nowait()
+            queue_.put_nowait(entry)
+        self.announced_event.set()
 
     def on_subscription_matched(self, reader, status):
         """Track when registration publishers are discovered"""
-        logger.debug(f"🤝 TRACE: Registration subscription matched event. Current count: {status.current_count}")
-        # We're not using this for discovery anymore, just logging for debugging
+        logger.debug("🤝 TRACE: Registration subscription matched event. Current count: %d", status.current_count)
+        if status.current_count > 0:
+            self._loop.call_soon_threadsafe(self.matched_event.set)
+        else:
+            self._loop.call_soon_threadsafe(self.matched_event.clear)
 
     # --- Helper methods to run async callbacks --- 
+    async def _run_callbacks(self, changes):
+        """Run the discovery/departure callbacks for one take, in sample order."""
+        for change in changes:
+            if isinstance(change, str):
+                await self._run_departure_callback(change)
+            else:
+                await self._run_discovery_callback(change)
+
     async def _run_discovery_callback(self, agent_info: Dict[str, Any]):
         """Safely run the discovery callback coroutine."""
         try:
@@ -114,8 +237,7 @@ class RegistrationListener(dds.DynamicData.NoOpDataReaderListener):
                 await self.on_agent_discovered(agent_info)
         except Exception as cb_e:
             instance_id = agent_info.get('instance_id', 'UNKNOWN')
-            logger.error(f"❌ TRACE: Error executing on_agent_discovered callback task for {instance_id}: {cb_e}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ TRACE: Error executing on_agent_discovered callback task for %s: %s", instance_id, cb_e)
             
     async def _run_departure_callback(self, instance_id: str):
         """Safely run the departure callback coroutine."""
@@ -124,8 +246,7 @@ class RegistrationListener(dds.DynamicData.NoOpDataReaderListener):
             if self.on_agent_departed:
                 await self.on_agent_departed(instance_id)
         except Exception as cb_e:
-            logger.error(f"❌ TRACE: Error executing on_agent_departed callback task for {instance_id}: {cb_e}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ TRACE: Error executing on_agent_departed callback task for %s: %s", instance_id, cb_e)
     # --- End helper methods --- 
 
 class GenesisInterface(ABC):
@@ -137,20 +258,23 @@ class GenesisInterface(ABC):
         self.discovered_agent_service_name: Optional[str] = None # To store discovered agent service name
         self.requester: Optional[rpc.Requester] = None # Requester will be created after discovery
         
-        # Get types from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
+        # Get types from the shared XML provider; parsed types are reused across interfaces
+        self.type_provider = get_type_provider()
         # Hardcode InterfaceAgent request/reply types
-        self.request_type = self.type_provider.type("genesis_lib", "InterfaceAgentRequest")
-        self.reply_type = self.type_provider.type("genesis_lib", "InterfaceAgentReply")
-        
-        # Store member names for later use
-        self.reply_members = [member.name for member in self.reply_type.members()]
+        self.request_type, self.reply_type, self.reply_members = _interface_agent_types()
+        # Per-thread reusable request samples, populated on the thread that sends them
+        self._request_tls = threading.local()
+        # Requests are served by one long-lived thread fed through this queue
+        self._request_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._request_worker: Optional[threading.Thread] = None
+        # Wakes the requester thread's WaitSet when a request is queued
+        self._request_guard = dds.GuardCondition()
         
         # Placeholders for callbacks
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._on_agent_discovered_callback: Optional[Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]] = None
         self._on_agent_departed_callback: Optional[Callable[[str], Coroutine[Any, Any, None]]] = None
+        self.registration_listener: Optional[RegistrationListener] = None
         
         # Set up registration monitoring with listener
         self._loop = asyncio.get_running_loop()
@@ -161,17 +285,8 @@ class GenesisInterface(ABC):
         try:
             logger.debug("🔧 TRACE: Setting up registration monitoring...")
             
-            # Configure reader QoS
-            reader_qos = dds.QosProvider.default.datareader_qos
-            reader_qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
-            reader_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
-            reader_qos.history.kind = dds.HistoryKind.KEEP_LAST
-            reader_qos.history.depth = 500  # Match agent's writer depth
-            reader_qos.liveliness.kind = dds.LivelinessKind.AUTOMATIC
-            reader_qos.liveliness.lease_duration = dds.Duration(seconds=2)
-            reader_qos.ownership.kind = dds.OwnershipKind.SHARED
-            
-            logger.debug("📋 TRACE: Configured reader QoS settings")
+            # Reader QoS is identical for every interface and built once per process
+            reader_qos = _registration_reader_qos()
             
             # Create registration reader with listener
             logger.debug("🎯 TRACE: Creating registration listener...")
@@ -194,8 +309,7 @@ class GenesisInterface(ABC):
             logger.debug("✅ TRACE: Registration monitoring setup complete")
             
         except Exception as e:
-            logger.error(f"❌ TRACE: Error setting up registration monitoring: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ TRACE: Error setting up registration monitoring: %s", e)
             raise
 
     async def connect_to_agent(self, service_name: str, timeout_seconds: float = 5.0) -> bool:
@@ -205,9 +319,9 @@ class GenesisInterface(ABC):
         """
         if self.requester:
              logger.warning(f"⚠️ TRACE: Requester already exists for service '{self.discovered_agent_service_name}'. Overwriting.")
-             self.requester.close()
+             await self._release_requester()
 
-        logger.debug(f"🔗 TRACE: Attempting to connect to agent service: {service_name}")
+        logger.debug("🔗 TRACE: Attempting to connect to agent service: %s", service_name)
         try:
             self.requester = rpc.Requester(
                 request_type=self.request_type,
@@ -217,34 +331,115 @@ class GenesisInterface(ABC):
             )
             self.discovered_agent_service_name = service_name
 
-            start_time = time.time()
-            while self.requester.matched_replier_count == 0:
-                if time.time() - start_time > timeout_seconds:
-                    logger.error(f"❌ TRACE: Timeout ({timeout_seconds}s) waiting for DDS replier match for service '{service_name}'")
-                    self.requester.close()
-                    self.requester = None
-                    self.discovered_agent_service_name = None
-                    return False
-                await asyncio.sleep(0.1)
+            # Block in a worker thread on the DDS match statuses instead of polling
+            if not await asyncio.to_thread(wait_for_replier_match, self.requester, timeout_seconds):
+                logger.error(f"❌ TRACE: Timeout ({timeout_seconds}s) waiting for DDS replier match for service '{service_name}'")
+                self.requester.close()
+                self.requester = None
+                self.discovered_agent_service_name = None
+                return False
             
-            logger.debug(f"✅ TRACE: RPC Requester created and DDS replier matched for service: {service_name}")
+            logger.debug("✅ TRACE: RPC Requester created and DDS replier matched for service: %s", service_name)
             return True
             
         except Exception as req_e:
-            logger.error(f"❌ TRACE: Failed to create or match RPC Requester for service '{service_name}': {req_e}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ TRACE: Failed to create or match RPC Requester for service '%s': %s", service_name, req_e)
             self.requester = None
             self.discovered_agent_service_name = None
             return False
 
+    async def _release_requester(self):
+        """
+        Close the current requester once the requester thread has let go of it.
+
+        Requests already queued for it are written first; those still awaiting
+        replies resolve to None.
+        """
+        requester = self.requester
+        # New requests are refused until a replacement is connected
+        self.requester = None
+        if self._request_worker is not None:
+            released = threading.Event()
+            self._request_queue.put((_RELEASE_REQUESTER, released))
+            self._request_guard.trigger_value = True
+            await asyncio.to_thread(released.wait)
+        requester.close()
+
+    async def wait_for_agent(self, timeout_seconds: float = 30.0) -> bool:
+        """
+        Wait until an agent is available.
+
+        Races the registration listener's announcement event against the RPC
+        replier match of an already-created requester, and returns as soon as
+        either fires rather than waiting on them in turn.
+
+        Args:
+            timeout_seconds: Maximum time to wait for either signal
+
+        Returns:
+            bool: True if an agent has been discovered or matched, False on timeout
+        """
+        # Agents the listener has already taken count immediately; no reader scan or task needed
+        listener = self.registration_listener
+        if listener.received_announcements:
+            return True
+        if not self.requester:
+            # Only one signal to wait for, so skip the race and its task bookkeeping
+            try:
+                await asyncio.wait_for(listener.announced_event.wait(), timeout=timeout_seconds)
+                return True
+            except asyncio.TimeoutError:
+                logger.error(f"❌ TRACE: Timeout ({timeout_seconds}s) waiting for agent announcement")
+                return False
+        announce_fut = asyncio.ensure_future(listener.announced_event.wait())
+        # Guard lets the match wait in the worker thread be abandoned once the race is decided
+        cancel_match = dds.GuardCondition()
+        match_fut = asyncio.ensure_future(
+            asyncio.to_thread(wait_for_replier_match, self.requester, timeout_seconds, cancel_match)
+        )
+        waiters = {announce_fut, match_fut}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        try:
+            while waiters:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, waiters = await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    if fut.result():
+                        logger.debug("Agent available via %s",
+                                     "registration announcement" if fut is announce_fut else "RPC replier match")
+                        return True
+            logger.error(f"❌ TRACE: Timeout ({timeout_seconds}s) waiting for agent announcement")
+            return False
+        finally:
+            for fut in waiters:
+                fut.cancel()
+            cancel_match.trigger_value = True
+
+    async def next_agent_announcement(self, timeout_seconds: float = 30.0) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next agent announcement, in arrival order.
+
+        Args:
+            timeout_seconds: Maximum time to wait for an announcement
+
+        Returns:
+            Optional[Dict[str, Any]]: The announced agent's info, or None on timeout
+        """
+        try:
+            return await asyncio.wait_for(self.registration_listener.announcement_queue.get(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            return None
+
     async def _wait_for_rpc_match(self):
         """Helper to wait for RPC discovery"""
         if not self.requester:
              logger.warning("⚠️ TRACE: Requester not created yet, cannot wait for RPC match.")
              return
-        while self.requester.matched_replier_count == 0:
-            await asyncio.sleep(0.1)
-        logger.debug(f"RPC match confirmed for service: {self.discovered_agent_service_name}!")
+        await asyncio.to_thread(wait_for_replier_match, self.requester)
+        logger.debug("RPC match confirmed for service: %s!", self.discovered_agent_service_name)
 
     async def send_request(self, request_data: Dict[str, Any], timeout_seconds: float = 10.0) -> Optional[Dict[str, Any]]:
         """Send request to agent and wait for reply"""
@@ -253,47 +448,22 @@ class GenesisInterface(ABC):
             return None
             
         try:
-            # Create request
-            request = dds.DynamicData(self.request_type)
-            for key, value in request_data.items():
-                request[key] = value
-                
-            # Send request and wait for reply using synchronous API in a thread
-            logger.debug(f"Sending request to agent service '{self.discovered_agent_service_name}': {request_data}")
-            
-            def _send_request_sync(requester, req, timeout):
-                # Ensure the requester is valid before using it
-                if requester is None:
-                    logger.error("❌ TRACE: _send_request_sync called with None requester.")
-                    return None
-                try:
-                    request_id = requester.send_request(req)
-                    # Convert float seconds to int seconds and nanoseconds
-                    seconds = int(timeout)
-                    nanoseconds = int((timeout - seconds) * 1e9)
-                    replies = requester.receive_replies(
-                        max_wait=dds.Duration(seconds=seconds, nanoseconds=nanoseconds),
-                        min_count=1,
-                        related_request_id=request_id
-                    )
-                    if replies:
-                        return replies[0]  # Returns (reply, info) tuple
-                    return None
-                except Exception as sync_e:
-                    logger.error(f"❌ TRACE: Error in _send_request_sync: {sync_e}")
-                    logger.error(traceback.format_exc())
-                    return None
-                
-            result = await asyncio.to_thread(_send_request_sync, self.requester, request, timeout_seconds)
+            # Queue the request for the requester thread, which pipelines it with any others in flight
+            logger.debug("Sending request to agent service '%s': %s", self.discovered_agent_service_name, request_data)
+            self._ensure_request_worker()
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._request_queue.put((self.requester, request_data, timeout_seconds, loop, future))
+            self._request_guard.trigger_value = True
+            result = await future
             
             if result:
                 reply, info = result
-                # Convert reply to dict
-                reply_dict = {}
-                for member in self.reply_members:
-                    reply_dict[member] = reply[member]
+                # Convert reply to dict; reply_members is a precomputed tuple
+                reply_members = self.reply_members
+                reply_dict = dict(zip(reply_members, map(reply.__getitem__, reply_members)))
                     
-                logger.debug(f"Received reply from agent: {reply_dict}")
+                logger.debug("Received reply from agent: %s", reply_dict)
                 return reply_dict
             else:
                 logger.error("No reply received")
@@ -306,12 +476,155 @@ class GenesisInterface(ABC):
             logger.error(f"Error sending request: {e}")
             return None
 
+    # Sync version of send_request for callers without a running event loop
+    def send_request_sync(self, request_data: Dict[str, Any], timeout_seconds: float = 10.0) -> Optional[Dict[str, Any]]:
+        """Synchronous version of send_request for callers without a running event loop"""
+        loop = new_event_loop()
+        try:
+            return loop.run_until_complete(self.send_request(request_data, timeout_seconds))
+        finally:
+            loop.close()
+
+    def _write_request(self, requester, data):
+        """Write one request and return its sample identity, or None if it could not be sent."""
+        try:
+            if not data:
+                # No-argument requests share one sample that is never modified, so skip the clear/fill
+                request = getattr(self._request_tls, 'empty_request', None)
+                if request is None:
+                    request = self._request_tls.empty_request = dds.DynamicData(self.request_type)
+                return requester.send_request(request)
+            # Reuse this worker thread's request sample rather than allocating one per call
+            request = getattr(self._request_tls, 'request', None)
+            if request is None:
+                request = self._request_tls.request = dds.DynamicData(self.request_type)
+            else:
+                request.clear_all_members()
+            for key, value in data.items():
+                request[key] = value
+            return requester.send_request(request)
+        except Exception as send_e:
+            logger.exception("❌ TRACE: Error sending request: %s", send_e)
+            return None
+
+    def _ensure_request_worker(self):
+        """Start the requester thread on first use."""
+        if self._request_worker is None:
+            self._request_worker = threading.Thread(
+                target=self._request_worker_loop,
+                name=f"{self.interface_name}-requester",
+                daemon=True
+            )
+            self._request_worker.start()
+
+    def _request_worker_loop(self):
+        """
+        Pipeline queued requests on one long-lived thread.
+
+        Every queued request is written as soon as it arrives, without waiting for
+        earlier replies. Replies are taken in batches and matched to their callers
+        by related sample identity; requests past their deadline resolve to None.
+        The thread sleeps on a WaitSet woken by new replies or by the enqueue guard,
+        lets go of its requester on _RELEASE_REQUESTER and exits on the None sentinel.
+        """
+        # Bind the per-request callables once for the lifetime of the thread
+        get_nowait = self._request_queue.get_nowait
+        write_request = self._write_request
+        monotonic = time.monotonic
+        guard = self._request_guard
+        waitset = dds.WaitSet()
+        waitset.attach_condition(guard)
+        requester = None
+        reply_condition = None
+        pending = []  # [request identity, deadline, loop, future]
+
+        while True:
+            # Reset before draining so an enqueue racing with the drain re-triggers it
+            guard.trigger_value = False
+            while True:
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    for _, _, loop, future in pending:
+                        loop.call_soon_threadsafe(_resolve_future, future, None)
+                    return
+                if item[0] is _RELEASE_REQUESTER:
+                    # The interface is about to close this requester; stop watching it first
+                    for _, _, old_loop, old_future in pending:
+                        old_loop.call_soon_threadsafe(_resolve_future, old_future, None)
+                    pending.clear()
+                    if reply_condition is not None:
+                        waitset.detach_condition(reply_condition)
+                    requester = reply_condition = None
+                    item[1].set()
+                    continue
+                item_requester, data, timeout, loop, future = item
+                if item_requester is not requester:
+                    # The interface reconnected; replies for the old requester will not arrive
+                    for _, _, old_loop, old_future in pending:
+                        old_loop.call_soon_threadsafe(_resolve_future, old_future, None)
+                    pending.clear()
+                    if reply_condition is not None:
+                        waitset.detach_condition(reply_condition)
+                    requester = item_requester
+                    reply_condition = dds.StatusCondition(requester.reply_datareader)
+                    reply_condition.enabled_statuses = dds.StatusMask.DATA_AVAILABLE
+                    waitset.attach_condition(reply_condition)
+                identity = write_request(requester, data)
+                if identity is None:
+                    loop.call_soon_threadsafe(_resolve_future, future, None)
+                else:
+                    pending.append([identity, monotonic() + timeout, loop, future])
+
+            if reply_condition is not None and reply_condition.trigger_value:
+                # Take even with nothing pending: a late reply left unread keeps
+                # DATA_AVAILABLE set and would wake the WaitSet on every pass.
+                # Replies whose request already resolved are discarded.
+                try:
+                    replies = requester.take_replies()
+                except Exception:
+                    logger.exception("Error taking replies")
+                    replies = ()
+                for reply, info in replies:
+                    if not info.valid:
+                        continue
+                    related = info.related_original_publication_virtual_sample_identity
+                    for index, entry in enumerate(pending):
+                        if entry[0] == related:
+                            del pending[index]
+                            entry[2].call_soon_threadsafe(_resolve_future, entry[3], (reply, info))
+                            break
+
+            if pending:
+                now = monotonic()
+                expired = [entry for entry in pending if entry[1] <= now]
+                if expired:
+                    pending = [entry for entry in pending if entry[1] > now]
+                    for _, _, loop, future in expired:
+                        loop.call_soon_threadsafe(_resolve_future, future, None)
+
+            if pending:
+                max_wait = wait_duration(min(entry[1] for entry in pending) - monotonic())
+            else:
+                max_wait = dds.Duration.infinite
+            try:
+                waitset.wait(max_wait)
+            except dds.TimeoutError:
+                pass
+
     async def close(self):
         """Clean up resources"""
-        if hasattr(self, 'requester') and self.requester: # Check if requester exists before closing
+        if self._request_worker is not None:
+            # Stop the requester thread before the requester is closed under it
+            self._request_queue.put(None)
+            self._request_guard.trigger_value = True
+            await asyncio.to_thread(self._request_worker.join)
+            self._request_worker = None
+        if self.requester: # Check if requester exists before closing
             self.requester.close()
-        if hasattr(self, 'app'):
-            await self.app.close()
+        await self.app.close()
 
     # --- New Callback Registration Methods ---
     def register_discovery_callback(self, callback: Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]):
@@ -319,7 +632,7 @@ class GenesisInterface(ABC):
         logger.debug(f"🔧 TRACE: Registering discovery callback: {callback.__name__ if callback else 'None'}")
         self._on_agent_discovered_callback = callback
         # If listener already exists, update its callback directly
-        if hasattr(self, 'registration_listener') and self.registration_listener:
+        if self.registration_listener:
             self.registration_listener.on_agent_discovered = callback
 
     def register_departure_callback(self, callback: Callable[[str], Coroutine[Any, Any, None]]):
@@ -327,6 +640,6 @@ class GenesisInterface(ABC):
         logger.debug(f"🔧 TRACE: Registering departure callback: {callback.__name__ if callback else 'None'}")
         self._on_agent_departed_callback = callback
         # If listener already exists, update its callback directly
-        if hasattr(self, 'registration_listener') and self.registration_listener:
+        if self.registration_listener:
             self.registration_listener.on_agent_departed = callback
     # --- End New Callback Registration Methods --- 
\ No newline at end of file
@@ -4,12 +4,15 @@ LLM-related functionality for the GENESIS library
 
 import logging
 from typing import Optional, Dict, Any, List
+from collections import OrderedDict
 from datetime import datetime
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from anthropic import Anthropic
 import os
 
+DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant."
+
 @dataclass
 class Message:
     """Represents a single message in the conversation"""
@@ -25,15 +28,16 @@ class ChatAgent(ABC):
         self.model_name = model_name
         self.system_prompt = system_prompt
         self.max_history = max_history
-        self.conversations: Dict[str, List[Message]] = {}
+        # Least recently active conversation first, so eviction is a popitem.
+        # Messages are stored as {"role", "content"} dicts, the shape the chat APIs take.
+        self.conversations: OrderedDict[str, List[Dict[str, str]]] = OrderedDict()
         self.logger = logging.getLogger(__name__)
     
     def _cleanup_old_conversations(self):
         """Remove old conversations if we exceed max_history"""
-        if len(self.conversations) > self.max_history:
-            # Remove oldest conversation
-            oldest_id = min(self.conversations.items(), key=lambda x: x[1][-1].timestamp)[0]
-            del self.conversations[oldest_id]
+        while len(self.conversations) > self.max_history:
+            # Remove the least recently active conversation
+            self.conversations.popitem(last=False)
     
     @abstractmethod
     def generate_response(self, message: str, conversation_id: str) -> tuple[str, int]:
@@ -44,7 +48,8 @@ class AnthropicChatAgent(ChatAgent):
     """Chat agent using Anthropic's Claude model"""
     def __init__(self, model_name: str = "claude-3-opus-20240229", api_key: Optional[str] = None,
                  system_prompt: Optional[str] = None, max_history: int = 10):
-        super().__init__("Claude", model_name, system_prompt, max_history)
+        # Resolve the default prompt once rather than on every request
+        super().__init__("Claude", model_name, system_prompt or DEFAULT_SYSTEM_PROMPT, max_history)
         # Get API key from environment if not provided
         if api_key is None:
             api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -56,32 +61,28 @@ class AnthropicChatAgent(ChatAgent):
     def generate_response(self, message: str, conversation_id: str) -> tuple[str, int]:
         """Generate a response using Claude"""
         try:
-            self.logger.warning(f"AnthropicChatAgent.generate_response called with message: '{message[:30]}...' - this may cause rate limit issues")
+            self.logger.warning("AnthropicChatAgent.generate_response called with message: '%s...' - this may cause rate limit issues", message[:30])
+            
+            # Only non-empty messages ever enter the history, so it never needs filtering
+            if not message.strip():
+                return "Cannot respond to an empty message", 1
             
             # Get or create conversation history
-            if conversation_id not in self.conversations:
-                self.conversations[conversation_id] = []
+            conversation = self.conversations.get(conversation_id)
+            if conversation is None:
+                conversation = self.conversations[conversation_id] = []
+            else:
+                self.conversations.move_to_end(conversation_id)
             
             # Add user message
-            self.conversations[conversation_id].append(
-                Message(role="user", content=message)
-            )
-            
-            # Clean up empty messages from conversation history
-            self.conversations[conversation_id] = [
-                msg for msg in self.conversations[conversation_id]
-                if msg.content.strip()  # Keep only messages with non-empty content
-            ]
+            conversation.append({"role": "user", "content": message})
             
             # Generate response
             response = self.client.messages.create(
                 model=self.model_name,
                 max_tokens=4096,
-                system=self.system_prompt if self.system_prompt else "You are a helpful AI assistant.",
-                messages=[
-                    {"role": msg.role, "content": msg.content}
-                    for msg in self.conversations[conversation_id]
-                ]
+                system=self.system_prompt,
+                messages=conversation
             )
             
             # Get response text, handling empty responses
@@ -89,9 +90,7 @@ class AnthropicChatAgent(ChatAgent):
             
             # Add assistant response only if it's not empty
             if response_text.strip():
-                self.conversations[conversation_id].append(
-                    Message(role="assistant", content=response_text)
-                )
+                conversation.append({"role": "assistant", "content": response_text})
             
             # Cleanup old conversations
             self._cleanup_old_conversations()
@@ -99,5 +98,5 @@ class AnthropicChatAgent(ChatAgent):
             return response_text, 0
             
         except Exception as e:
-            self.logger.error(f"Error generating response: {e}")
+            self.logger.error("Error generating response: %s", e)
             return str(e), 1 
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Buffers behind the Genesis DDS logging classes.
+
+The bounded ring between DDSLogHandler and LogPublisher's publish worker, and
+the helpers that build and query LogSubscriber's stored log dictionaries. Only
+the standard library is used here, so these can be loaded and tested without
+Connext; genesis_monitoring wires them to the DDS readers and writers.
+
+Copyright (c) 2025, RTI & Jason Upchurch
+"""
+
+import operator
+import threading
+from collections import deque
+
+# Keys of the log dictionaries kept by LogSubscriber, read from each LogMessage in one call
+_LOG_FIELDS = (
+    "log_id", "timestamp", "source_id", "source_name", "level", "level_name",
+    "message", "logger_name", "thread_id", "thread_name", "file_name",
+    "line_number", "function_name"
+)
+_log_fields = operator.attrgetter(*_LOG_FIELDS)
+
+
+class _LogRing:
+    """
+    Bounded multi-producer / single-consumer FIFO between log producers and the
+    publish worker.
+
+    Producers never wait for the consumer: when the ring is full the record is
+    dropped and counted in `dropped_count`. Pushes from several threads are
+    serialized by a short lock so the capacity check and the drop count stay
+    exact; the consumer only removes items and does not take it. The consumer
+    is woken through an Event that is set on every push and cleared by the
+    consumer before it parks.
+    """
+    def __init__(self, capacity):
+        self._items = deque()
+        self._capacity = capacity
+        self._push_lock = threading.Lock()
+        self._not_empty = threading.Event()
+        self._woken = False
+        self.dropped_count = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def try_push(self, item) -> bool:
+        """Append an item, returning False (and counting the drop) if the ring is full."""
+        with self._push_lock:
+            if len(self._items) >= self._capacity:
+                self.dropped_count += 1
+                return False
+            self._items.append(item)
+        self._not_empty.set()
+        return True
+
+    def pop_batch(self, up_to=64) -> list:
+        """Remove and return up to `up_to` items in FIFO order; call from the consumer only."""
+        # Producers only append, so the `count` items seen here stay available
+        popleft = self._items.popleft
+        count = min(up_to, len(self._items))
+        return [popleft() for _ in range(count)]
+
+    def wait(self, timeout=None) -> bool:
+        """Park until an item is pushed or wake() is called; returns False on timeout."""
+        self._not_empty.clear()
+        # Re-check after the clear, which would otherwise erase a push or wake
+        # that landed between the consumer's last check and this call
+        if self._items or self._woken:
+            return True
+        return self._not_empty.wait(timeout)
+
+    def wake(self):
+        """
+        Wake the consumer without pushing an item (used on shutdown).
+
+        The wake is sticky: every later wait() also returns at once, so a consumer
+        that has not parked yet cannot miss it.
+        """
+        self._woken = True
+        self._not_empty.set()
+
+
+def _log_entries(samples):
+    """Build a log dictionary, keyed by _LOG_FIELDS, from each received LogMessage."""
+    extract = _log_fields
+    return [dict(zip(_LOG_FIELDS, extract(log_data))) for log_data in samples]
+
+
+def _append_bounded(logs, entries, limit):
+    """Append entries to a list of logs, then drop the oldest beyond `limit`."""
+    logs.extend(entries)
+    excess = len(logs) - limit
+    if excess > 0:
+        del logs[:excess]
+
+
+def _select_logs(logs, max_count=None, level_filter=None, source_filter=None):
+    """
+    Return the logs passing the filters, keeping at most the newest `max_count`.
+
+    Args:
+        logs: Log dictionaries in chronological order
+        max_count: Maximum number of logs to return
+        level_filter: Minimum log level to include
+        source_filter: Source ID or name to filter by
+
+    Returns:
+        List of matching log dictionaries in chronological order
+    """
+    # Single pass from newest to oldest, stopping once max_count logs match
+    selected = []
+    for log in reversed(logs):
+        if level_filter is not None and log["level"] < level_filter:
+            continue
+        if source_filter is not None and source_filter not in (log["source_id"], log["source_name"]):
+            continue
+        selected.append(log)
+        if max_count and len(selected) >= max_count:
+            break
+    
+    # Restore chronological order
+    selected.reverse()
+    return selected
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 # Define all known logger names used within the genesis_lib
@@ -17,6 +18,11 @@ GENESIS_LIB_LOGGERS = [
     # Add other genesis_lib logger names here as they are created
 ]
 
+@functools.lru_cache(maxsize=None)
+def _get_loggers(logger_names: tuple) -> tuple:
+    """Resolve the named loggers once; keyed by the names so additions to the list are picked up."""
+    return tuple(logging.getLogger(name) for name in logger_names)
+
 def set_genesis_library_log_level(level: int) -> None:
     """
     Sets the logging level for all predefined genesis_lib loggers.
@@ -24,12 +30,11 @@ def set_genesis_library_log_level(level: int) -> None:
     Args:
         level: The logging level (e.g., logging.DEBUG, logging.INFO).
     """
-    for logger_name in GENESIS_LIB_LOGGERS:
-        logging.getLogger(logger_name).setLevel(level)
     # Also set the level for the root of the genesis_lib package itself,
     # in case some modules use logging.getLogger(__name__) directly under genesis_lib
     # and are not in the explicit list.
-    logging.getLogger("genesis_lib").setLevel(level)
+    for logger in _get_loggers((*GENESIS_LIB_LOGGERS, "genesis_lib")):
+        logger.setLevel(level)
 
 def get_genesis_library_loggers() -> list[str]:
     """Returns a copy of the list of known genesis_lib logger names."""
@@ -12,18 +12,21 @@ Copyright (c) 2025, RTI & Jason Upchurch
 
 import logging
 import time
-import uuid
 import json
 import os
+import queue
+import threading
+from collections import deque
 from typing import Any, Dict, Optional, List
 import rti.connextdds as dds
 import rti.rpc as rpc
-from genesis_lib.utils import get_datamodel_path
+from genesis_lib.utils import get_type_provider, get_type, next_event_id
 from .agent import GenesisAgent
 from genesis_lib.generic_function_client import GenericFunctionClient
 import traceback
 import asyncio
 from datetime import datetime
+from functools import cached_property
 from genesis_lib.genesis_monitoring import MonitoringSubscriber
 
 # Configure logging
@@ -50,9 +53,155 @@ EVENT_CATEGORY_MAP = {
     "EDGE_DISCOVERY": 1,
     "STATE_CHANGE": 2,
     "AGENT_INIT": 3,
-    "AGENT_READY": 4
+    "AGENT_READY": 4,
+    "AGENT_SHUTDOWN": 5,
+    "DDS_ENDPOINT": 6
 }
 
+# Component state mapping
+COMPONENT_STATE_MAP = {
+    "JOINING": 0,
+    "DISCOVERING": 1,
+    "READY": 2,
+    "BUSY": 3,
+    "DEGRADED": 4,
+    "OFFLINE": 5
+}
+
+# (previous_state, new_state) implied by a lifecycle category when no states are given
+_CATEGORY_TRANSITIONS = {
+    "NODE_DISCOVERY": (COMPONENT_STATE_MAP["DISCOVERING"], COMPONENT_STATE_MAP["DISCOVERING"]),
+    "AGENT_INIT": (COMPONENT_STATE_MAP["OFFLINE"], COMPONENT_STATE_MAP["JOINING"]),
+    "AGENT_READY": (COMPONENT_STATE_MAP["DISCOVERING"], COMPONENT_STATE_MAP["READY"]),
+    "BUSY": (COMPONENT_STATE_MAP["READY"], COMPONENT_STATE_MAP["BUSY"]),
+    "READY": (COMPONENT_STATE_MAP["BUSY"], COMPONENT_STATE_MAP["READY"]),
+    "DEGRADED": (COMPONENT_STATE_MAP["BUSY"], COMPONENT_STATE_MAP["DEGRADED"]),
+}
+_DEFAULT_TRANSITION = (COMPONENT_STATE_MAP["DISCOVERING"], COMPONENT_STATE_MAP["DISCOVERING"])
+
+# Per-event members of each monitoring sample, in the order publishers supply their values
+_MONITORING_EVENT_FIELDS = (
+    "event_id", "timestamp", "event_type", "metadata", "call_data", "result_data", "status_data"
+)
+_LIFECYCLE_EVENT_FIELDS = (
+    "component_id", "previous_state", "new_state", "timestamp", "reason", "capabilities",
+    "event_category", "source_id", "target_id", "connection_type"
+)
+_CHAIN_EVENT_FIELDS = (
+    "chain_id", "call_id", "function_id", "query_id", "timestamp", "event_type", "source_id", "target_id"
+)
+
+# Maximum number of monitoring samples written per dispatcher wake-up
+MONITORING_BATCH_SIZE = 64
+
+# Events a gated channel holds while no monitor matches it; older ones are dropped
+MONITORING_PENDING_LIMIT = 256
+
+class _MonitoringChannel:
+    """
+    A monitoring writer and the one sample the dispatcher refills for each of its events.
+
+    Members that never change for the agent are set once here; `fields` names
+    the members every event supplies, in order.
+
+    A gated channel is only written while a monitor subscribes to its topic.
+    Whenever it has no subscriber, its newest events are held in `pending` and
+    written when a monitor matches again, so the TRANSIENT_LOCAL writer can
+    still hand them to late joiners.
+    """
+    __slots__ = ('writer', 'sample', 'fields', 'subscribed', 'pending', 'lock')
+
+    def __init__(self, writer, sample_type, fields, gated=False, **invariants):
+        self.writer = writer
+        self.sample = dds.DynamicData(sample_type)
+        for name, value in invariants.items():
+            self.sample[name] = value
+        self.fields = fields
+        self.subscribed = not gated
+        self.pending = deque(maxlen=MONITORING_PENDING_LIMIT) if gated else None
+        self.lock = threading.Lock()
+
+class _PublicationMatchListener(dds.DynamicData.NoOpDataWriterListener):
+    """Tells the dispatcher whether a gated channel's writer has any subscribers."""
+    def __init__(self, dispatcher, channel):
+        super().__init__()
+        self._dispatcher = dispatcher
+        self._channel = channel
+
+    def on_publication_matched(self, writer, status):
+        self._dispatcher.set_subscribed(self._channel, status.current_count > 0)
+
+class _MonitoringDispatcher:
+    """
+    Writes monitoring samples on a background thread.
+
+    Publishing methods hand a channel and a tuple of field values to `submit`
+    and return at once; the worker fills the channel's reusable sample and
+    writes the events in submission order. Writers are flushed only when the
+    dispatcher closes; reliable delivery does not depend on per-event flushes.
+    """
+    def __init__(self, name: str):
+        self._queue = queue.SimpleQueue()
+        self._written = {}
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, channel: _MonitoringChannel, values: tuple) -> None:
+        """Queue one event's values, in channel.fields order, for writing."""
+        if channel.subscribed:
+            self._queue.put((channel, values))
+            return
+        with channel.lock:
+            if channel.subscribed:
+                self._queue.put((channel, values))
+            else:
+                channel.pending.append(values)
+
+    def set_subscribed(self, channel: _MonitoringChannel, subscribed: bool) -> None:
+        """Record a gated channel's match state, releasing held events when a monitor matches."""
+        with channel.lock:
+            channel.subscribed = subscribed
+            if subscribed:
+                for values in channel.pending:
+                    self._queue.put((channel, values))
+                channel.pending.clear()
+
+    def close(self) -> None:
+        """Write everything already submitted, flush the writers, then stop the worker."""
+        self._queue.put(None)
+        self._thread.join()
+        for writer in self._written.values():
+            try:
+                writer.flush()
+            except Exception as e:
+                logger.exception("Error flushing monitoring writer: %s", e)
+
+    def _run(self):
+        queue_ = self._queue
+        while True:
+            batch = [queue_.get()]
+            while len(batch) < MONITORING_BATCH_SIZE:
+                try:
+                    batch.append(queue_.get_nowait())
+                except queue.Empty:
+                    break
+            written = self._written
+            for item in batch:
+                if item is None:
+                    break
+                channel, values = item
+                try:
+                    # Writers copy the sample, so the channel's one sample is refilled for every event
+                    sample = channel.sample
+                    for name, value in zip(channel.fields, values):
+                        sample[name] = value
+                    channel.writer.write(sample)
+                    written[id(channel)] = channel.writer
+                except Exception as e:
+                    logger.exception("Error writing monitoring sample: %s", e)
+            if item is None:
+                return
+
 class MonitoredAgent(GenesisAgent):
     """
     Base class for agents with monitoring capabilities.
@@ -105,11 +254,10 @@ class MonitoredAgent(GenesisAgent):
             "supported_tasks": []  # To be populated by subclasses
         }
         
-        # Get types from XML
-        config_path = get_datamodel_path()
-        self.type_provider = dds.QosProvider(config_path)
-        self.request_type = self.type_provider.type("genesis_lib", "InterfaceAgentRequest")
-        self.reply_type = self.type_provider.type("genesis_lib", "InterfaceAgentReply")
+        # Get types from the shared XML provider (parsed and resolved once per process)
+        self.type_provider = get_type_provider()
+        self.request_type = get_type("InterfaceAgentRequest")
+        self.reply_type = get_type("InterfaceAgentReply")
         
         # Set up monitoring
         self._setup_monitoring()
@@ -117,6 +265,14 @@ class MonitoredAgent(GenesisAgent):
         # Create subscription match listener
         self._setup_subscription_listener()
 
+        # Both startup events carry the same identity capabilities; serialize them once
+        identity_capabilities = json.dumps({
+            "agent_type": agent_type,
+            "service": base_service_name,
+            "description": self.description,
+            "agent_id": self.app.agent_id
+        })
+
         # Publish agent discovery event
         self.publish_component_lifecycle_event(
             category="NODE_DISCOVERY",
@@ -125,12 +281,7 @@ class MonitoredAgent(GenesisAgent):
             new_state="DISCOVERING",
             source_id=self.app.agent_id,
             target_id=self.app.agent_id,
-            capabilities=json.dumps({
-                "agent_type": agent_type,
-                "service": base_service_name,
-                "description": self.description,
-                "agent_id": self.app.agent_id
-            })
+            capabilities=identity_capabilities
         )
 
         # Publish agent ready event
@@ -141,15 +292,11 @@ class MonitoredAgent(GenesisAgent):
             new_state="READY",
             source_id=self.app.agent_id,
             target_id=self.app.agent_id,
-            capabilities=json.dumps({
-                "agent_type": agent_type,
-                "service": base_service_name,
-                "description": self.description,
-                "agent_id": self.app.agent_id
-            })
+            capabilities=identity_capabilities
         )
         
-        logger.info(f"Monitored agent {agent_name} initialized with type {agent_type}, agent_id={self.app.agent_id}, dds_guid={self.app.dds_guid}")
+        logger.info("Monitored agent %s initialized with type %s, agent_id=%s, dds_guid=%s",
+                    agent_name, agent_type, self.app.agent_id, self.app.dds_guid)
     
     def _initialize_function_client(self) -> None:
         """Initialize the GenericFunctionClient if not already done."""
@@ -164,8 +311,11 @@ class MonitoredAgent(GenesisAgent):
         Set up monitoring resources and initialize state.
         """
         try:
+            # Monitoring writes happen off the request path, on this dispatcher's thread
+            self._monitoring_dispatcher = _MonitoringDispatcher(f"{self.agent_name}-monitoring")
+            
             # Get monitoring type from XML
-            self.monitoring_type = self.type_provider.type("genesis_lib", "MonitoringEvent")
+            self.monitoring_type = get_type("MonitoringEvent")
             
             # Create monitoring topic
             self.monitoring_topic = dds.DynamicData.Topic(
@@ -194,9 +344,9 @@ class MonitoredAgent(GenesisAgent):
 
             # Set up enhanced monitoring (V2)
             # Create topics for new monitoring types
-            self.component_lifecycle_type = self.type_provider.type("genesis_lib", "ComponentLifecycleEvent")
-            self.chain_event_type = self.type_provider.type("genesis_lib", "ChainEvent")
-            self.liveliness_type = self.type_provider.type("genesis_lib", "LivelinessUpdate")
+            self.component_lifecycle_type = get_type("ComponentLifecycleEvent")
+            self.chain_event_type = get_type("ChainEvent")
+            self.liveliness_type = get_type("LivelinessUpdate")
 
             # Create topics
             self.component_lifecycle_topic = dds.DynamicData.Topic(
@@ -215,12 +365,7 @@ class MonitoredAgent(GenesisAgent):
                 self.liveliness_type
             )
 
-            # Create writers with QoS
-            writer_qos = dds.QosProvider.default.datawriter_qos
-            writer_qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
-            writer_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
-
-            # Create writers for each monitoring type using the same publisher
+            # Create writers for each monitoring type using the same publisher and writer QoS
             self.component_lifecycle_writer = dds.DynamicData.DataWriter(
                 pub=self.monitoring_publisher,
                 topic=self.component_lifecycle_topic,
@@ -237,6 +382,37 @@ class MonitoredAgent(GenesisAgent):
                 qos=writer_qos
             )
             
+            # Reusable samples with the agent-invariant members filled in once
+            self._monitoring_channel = _MonitoringChannel(
+                self.monitoring_writer, self.monitoring_type, _MONITORING_EVENT_FIELDS, gated=True,
+                entity_type=AGENT_TYPE_MAP.get(self.agent_type, 1),  # Default to PRIMARY_AGENT if type not found
+                entity_id=self.agent_name
+            )
+            self._lifecycle_channel = _MonitoringChannel(
+                self.component_lifecycle_writer, self.component_lifecycle_type, _LIFECYCLE_EVENT_FIELDS,
+                component_type=2  # AGENT
+            )
+            self._chain_channel = _MonitoringChannel(
+                self.chain_event_writer, self.chain_event_type, _CHAIN_EVENT_FIELDS, gated=True,
+                interface_id=self.app.dds_guid,
+                primary_agent_id="",
+                specialized_agent_ids="",
+                status=0
+            )
+            
+            # Per-request monitoring and chain events are only written while a monitor
+            # subscribes; in between, the newest are held for the next match. Lifecycle events stay ungated: they carry the agent's durable
+            # state for late-joining monitors, and this agent's own lifecycle reader
+            # always matches that writer anyway.
+            self._publication_match_listeners = []
+            for channel in (self._monitoring_channel, self._chain_channel):
+                listener = _PublicationMatchListener(self._monitoring_dispatcher, channel)
+                channel.writer.set_listener(listener, dds.StatusMask.PUBLICATION_MATCHED)
+                self._publication_match_listeners.append((channel.writer, listener))
+                # A monitor may have matched before the listener was attached
+                if channel.writer.publication_matched_status.current_count > 0:
+                    self._monitoring_dispatcher.set_subscribed(channel, True)
+            
             # Initialize state tracking
             self.current_state = "OFFLINE"
             self.last_state_change = datetime.now()
@@ -325,28 +501,17 @@ class MonitoredAgent(GenesisAgent):
             request_info: Request information containing client ID
         """
         try:
-            event = dds.DynamicData(self.monitoring_type)
-            
-            # Set basic fields
-            event["event_id"] = str(uuid.uuid4())
-            event["timestamp"] = int(time.time() * 1000)
-            event["event_type"] = EVENT_TYPE_MAP[event_type]
-            event["entity_type"] = AGENT_TYPE_MAP.get(self.agent_type, 1)  # Default to PRIMARY_AGENT if type not found
-            event["entity_id"] = self.agent_name
-            
-            # Set optional fields
-            if metadata:
-                event["metadata"] = json.dumps(metadata)
-            if call_data:
-                event["call_data"] = json.dumps(call_data)
-            if result_data:
-                event["result_data"] = json.dumps(result_data)
-            if status_data:
-                event["status_data"] = json.dumps(status_data)
-            
-            # Write the event
-            self.monitoring_writer.write(event)
-            logger.debug(f"Published monitoring event: {event_type}")
+            # Queue the event for the monitoring thread; absent optional fields are left empty
+            self._monitoring_dispatcher.submit(self._monitoring_channel, (
+                next_event_id(),
+                int(time.time() * 1000),
+                EVENT_TYPE_MAP[event_type],
+                json.dumps(metadata) if metadata else "",
+                json.dumps(call_data) if call_data else "",
+                json.dumps(result_data) if result_data else "",
+                json.dumps(status_data) if status_data else ""
+            ))
+            logger.debug("Published monitoring event: %s", event_type)
             
         except Exception as e:
             logger.error(f"Error publishing monitoring event: {str(e)}")
@@ -379,99 +544,44 @@ class MonitoredAgent(GenesisAgent):
             connection_type: Type of connection for edge events
         """
         try:
-            if not hasattr(self, 'component_lifecycle_type') or not self.component_lifecycle_type:
-                logger.debug(f"Component lifecycle monitoring not initialized, skipping event: {category}")
-                return
-            
-            if not hasattr(self, 'component_lifecycle_writer') or not self.component_lifecycle_writer:
-                logger.debug(f"Component lifecycle writer not initialized, skipping event: {category}")
+            if not hasattr(self, '_lifecycle_channel'):
+                logger.debug("Component lifecycle monitoring not initialized, skipping event: %s", category)
                 return
 
-            # Map state strings to enum values
-            states = {
-                "JOINING": 0,
-                "DISCOVERING": 1,
-                "READY": 2,
-                "BUSY": 3,
-                "DEGRADED": 4,
-                "OFFLINE": 5
-            }
-
-            # Map event categories to enum values
-            event_categories = {
-                "NODE_DISCOVERY": 0,
-                "EDGE_DISCOVERY": 1,
-                "STATE_CHANGE": 2,
-                "AGENT_INIT": 3,
-                "AGENT_READY": 4,
-                "AGENT_SHUTDOWN": 5,
-                "DDS_ENDPOINT": 6
-            }
-
-            # Create event
-            event = dds.DynamicData(self.component_lifecycle_type)
-            
-            # Set component ID (use provided ID or agent name)
-            event["component_id"] = component_id if component_id else self.agent_name
-            
-            # Set component type (AGENT for agent)
-            event["component_type"] = 2
-            
             # Set states based on category or provided states
             if previous_state and new_state:
-                event["previous_state"] = states.get(previous_state, states["DISCOVERING"])
-                event["new_state"] = states.get(new_state, states["DISCOVERING"])
+                discovering = COMPONENT_STATE_MAP["DISCOVERING"]
+                transition = (COMPONENT_STATE_MAP.get(previous_state, discovering),
+                              COMPONENT_STATE_MAP.get(new_state, discovering))
             else:
-                if category == "NODE_DISCOVERY":
-                    event["previous_state"] = states["DISCOVERING"]
-                    event["new_state"] = states["DISCOVERING"]
-                elif category == "AGENT_INIT":
-                    event["previous_state"] = states["OFFLINE"]
-                    event["new_state"] = states["JOINING"]
-                elif category == "AGENT_READY":
-                    event["previous_state"] = states["DISCOVERING"]
-                    event["new_state"] = states["READY"]
-                elif category == "BUSY":
-                    event["previous_state"] = states["READY"]
-                    event["new_state"] = states["BUSY"]
-                elif category == "READY":
-                    event["previous_state"] = states["BUSY"]
-                    event["new_state"] = states["READY"]
-                elif category == "DEGRADED":
-                    event["previous_state"] = states["BUSY"]
-                    event["new_state"] = states["DEGRADED"]
-                else:
-                    event["previous_state"] = states["DISCOVERING"]
-                    event["new_state"] = states["DISCOVERING"]
-            
-            # Set other fields
-            event["timestamp"] = int(time.time() * 1000)
-            event["reason"] = reason if reason else (message if message else "")
-            event["capabilities"] = capabilities if capabilities else json.dumps(self.agent_capabilities)
+                transition = _CATEGORY_TRANSITIONS.get(category, _DEFAULT_TRANSITION)
             
-            # Set event category
-            if category in event_categories:
-                event["event_category"] = event_categories[category]
-            else:
-                event["event_category"] = event_categories["NODE_DISCOVERY"]
-            
-            # Set source and target IDs, defaulting to self.app.agent_id
-            event["source_id"] = source_id if source_id else self.app.agent_id
-            if category == "EDGE_DISCOVERY":
-                # For edge discovery, target is the function being discovered
-                event["target_id"] = target_id if target_id else self.app.agent_id
-                event["connection_type"] = connection_type if connection_type else "function_connection"
-            else:
-                # For other events, source and target are the same (self.app.agent_id)
-                event["target_id"] = target_id if target_id else self.app.agent_id
-                event["connection_type"] = connection_type if connection_type else ""
+            # Edge discovery defaults to a function connection; other events have none
+            if not connection_type:
+                connection_type = "function_connection" if category == "EDGE_DISCOVERY" else ""
 
-            self.component_lifecycle_writer.write(event)
-            self.component_lifecycle_writer.flush()
+            self._monitoring_dispatcher.submit(self._lifecycle_channel, (
+                component_id if component_id else self.agent_name,
+                transition[0],
+                transition[1],
+                int(time.time() * 1000),
+                reason if reason else (message if message else ""),
+                capabilities if capabilities else self._agent_capabilities_json,
+                EVENT_CATEGORY_MAP.get(category, EVENT_CATEGORY_MAP["NODE_DISCOVERY"]),
+                # Source and target default to this agent
+                source_id if source_id else self.app.agent_id,
+                target_id if target_id else self.app.agent_id,
+                connection_type
+            ))
         except Exception as e:
             logger.error(f"Error publishing component lifecycle event: {e}")
             logger.debug(f"Event category was: {category}")
     
+    @cached_property
+    def _agent_capabilities_json(self) -> str:
+        """agent_capabilities as JSON, reused until set_agent_capabilities changes them."""
+        return json.dumps(self.agent_capabilities)
+    
     async def process_request(self, request: Any) -> Dict[str, Any]:
         """
         Process a request with monitoring.
@@ -486,8 +596,8 @@ class MonitoredAgent(GenesisAgent):
             Dictionary containing the response data
         """
         # Generate chain and call IDs for tracking
-        chain_id = str(uuid.uuid4())
-        call_id = str(uuid.uuid4())
+        chain_id = next_event_id()
+        call_id = next_event_id()
 
         try:
             # Ensure we're in READY state before processing
@@ -626,6 +736,12 @@ class MonitoredAgent(GenesisAgent):
                 self.component_lifecycle_reader.set_listener(None, dds.StatusMask.NONE)
                 self.component_lifecycle_reader.close() # Also close the reader itself
 
+            # Stop match callbacks and write out queued events before the writers are closed
+            for writer, _ in getattr(self, '_publication_match_listeners', ()):
+                writer.set_listener(None, dds.StatusMask.NONE)
+            if hasattr(self, '_monitoring_dispatcher'):
+                await asyncio.to_thread(self._monitoring_dispatcher.close)
+
             # Clean up monitoring resources
             if hasattr(self, 'monitoring_writer'):
                 self.monitoring_writer.close()
@@ -683,7 +799,7 @@ class MonitoredAgent(GenesisAgent):
                         # This format is critical for the monitor to recognize it as an edge discovery event
                         provider_id = str(agent_info.get('instance_handle', ''))
                         client_id = str(self.app.participant.instance_handle)
-                        function_id = str(uuid.uuid4())
+                        function_id = next_event_id()
                         
                         # Format exactly as monitor expects for edge discovery
                         reason = f"provider={provider_id} client={client_id} function={function_id} name={self.base_service_name}"
@@ -889,7 +1005,7 @@ class MonitoredAgent(GenesisAgent):
         
         # Publish a monitoring event for each discovered function
         for func in functions:
-            function_id = func.get('function_id', str(uuid.uuid4()))
+            function_id = func['function_id'] if 'function_id' in func else next_event_id()
             function_name = func.get('name', 'unknown')
             provider_id = func.get('provider_id', '')
             
@@ -1072,107 +1188,63 @@ class MonitoredAgent(GenesisAgent):
             
         if additional_capabilities:
             self.agent_capabilities.update(additional_capabilities)
+        
+        # Drop the cached serialization so it is rebuilt from the updated capabilities
+        self.__dict__.pop('_agent_capabilities_json', None)
             
         # Publish updated capabilities
         self.publish_component_lifecycle_event(
             category="STATE_CHANGE",
             message="Agent capabilities updated",
-            capabilities=json.dumps(self.agent_capabilities),
+            capabilities=self._agent_capabilities_json,
             source_id=self.app.agent_id,
             target_id=self.app.agent_id
         ) 
 
+    def _publish_chain_event(self, chain_id: str, call_id: str, function_id: str, event_type: str,
+                             source_id: str, target_id: str):
+        """Queue a chain event; the interface and status members are fixed per agent"""
+        self._monitoring_dispatcher.submit(self._chain_channel, (
+            chain_id, call_id, function_id, next_event_id(), int(time.time() * 1000),
+            event_type, source_id, target_id
+        ))
+
     def _publish_llm_call_start(self, chain_id: str, call_id: str, model_identifier: str):
         """Publish a chain event for LLM call start"""
-        chain_event = dds.DynamicData(self.chain_event_type)
-        chain_event["chain_id"] = chain_id
-        chain_event["call_id"] = call_id
-        chain_event["interface_id"] = str(self.app.participant.instance_handle)
-        chain_event["primary_agent_id"] = ""
-        chain_event["specialized_agent_ids"] = ""
-        chain_event["function_id"] = model_identifier
-        chain_event["query_id"] = str(uuid.uuid4())
-        chain_event["timestamp"] = int(time.time() * 1000)
-        chain_event["event_type"] = "LLM_CALL_START"
-        chain_event["source_id"] = str(self.app.participant.instance_handle)
-        chain_event["target_id"] = "OpenAI"
-        chain_event["status"] = 0
-        
-        self.chain_event_writer.write(chain_event)
-        self.chain_event_writer.flush()
+        self._publish_chain_event(
+            chain_id, call_id, model_identifier, "LLM_CALL_START",
+            source_id=self.app.dds_guid,
+            target_id="OpenAI"
+        )
 
     def _publish_llm_call_complete(self, chain_id: str, call_id: str, model_identifier: str):
         """Publish a chain event for LLM call completion"""
-        chain_event = dds.DynamicData(self.chain_event_type)
-        chain_event["chain_id"] = chain_id
-        chain_event["call_id"] = call_id
-        chain_event["interface_id"] = str(self.app.participant.instance_handle)
-        chain_event["primary_agent_id"] = ""
-        chain_event["specialized_agent_ids"] = ""
-        chain_event["function_id"] = model_identifier
-        chain_event["query_id"] = str(uuid.uuid4())
-        chain_event["timestamp"] = int(time.time() * 1000)
-        chain_event["event_type"] = "LLM_CALL_COMPLETE"
-        chain_event["source_id"] = "OpenAI"
-        chain_event["target_id"] = str(self.app.participant.instance_handle)
-        chain_event["status"] = 0
-        
-        self.chain_event_writer.write(chain_event)
-        self.chain_event_writer.flush()
+        self._publish_chain_event(
+            chain_id, call_id, model_identifier, "LLM_CALL_COMPLETE",
+            source_id="OpenAI",
+            target_id=self.app.dds_guid
+        )
 
     def _publish_classification_result(self, chain_id: str, call_id: str, classified_function_name: str, classified_function_id: str):
         """Publish a chain event for function classification result"""
-        chain_event = dds.DynamicData(self.chain_event_type)
-        chain_event["chain_id"] = chain_id
-        chain_event["call_id"] = call_id
-        chain_event["interface_id"] = str(self.app.participant.instance_handle)
-        chain_event["primary_agent_id"] = ""
-        chain_event["specialized_agent_ids"] = ""
-        chain_event["function_id"] = classified_function_id
-        chain_event["query_id"] = str(uuid.uuid4())
-        chain_event["timestamp"] = int(time.time() * 1000)
-        chain_event["event_type"] = "CLASSIFICATION_RESULT"
-        chain_event["source_id"] = str(self.app.participant.instance_handle)
-        chain_event["target_id"] = classified_function_name
-        chain_event["status"] = 0
-        
-        self.chain_event_writer.write(chain_event)
-        self.chain_event_writer.flush()
+        self._publish_chain_event(
+            chain_id, call_id, classified_function_id, "CLASSIFICATION_RESULT",
+            source_id=self.app.dds_guid,
+            target_id=classified_function_name
+        )
 
     def _publish_function_call_start(self, chain_id: str, call_id: str, function_name: str, function_id: str, target_provider_id: str = None):
         """Publish a chain event for function call start"""
-        chain_event = dds.DynamicData(self.chain_event_type)
-        chain_event["chain_id"] = chain_id
-        chain_event["call_id"] = call_id
-        chain_event["interface_id"] = str(self.app.participant.instance_handle)
-        chain_event["primary_agent_id"] = ""
-        chain_event["specialized_agent_ids"] = ""
-        chain_event["function_id"] = function_id
-        chain_event["query_id"] = str(uuid.uuid4())
-        chain_event["timestamp"] = int(time.time() * 1000)
-        chain_event["event_type"] = "FUNCTION_CALL_START"
-        chain_event["source_id"] = str(self.app.participant.instance_handle)
-        chain_event["target_id"] = target_provider_id if target_provider_id else function_name
-        chain_event["status"] = 0
-        
-        self.chain_event_writer.write(chain_event)
-        self.chain_event_writer.flush()
+        self._publish_chain_event(
+            chain_id, call_id, function_id, "FUNCTION_CALL_START",
+            source_id=self.app.dds_guid,
+            target_id=target_provider_id if target_provider_id else function_name
+        )
 
     def _publish_function_call_complete(self, chain_id: str, call_id: str, function_name: str, function_id: str, source_provider_id: str = None):
         """Publish a chain event for function call completion"""
-        chain_event = dds.DynamicData(self.chain_event_type)
-        chain_event["chain_id"] = chain_id
-        chain_event["call_id"] = call_id
-        chain_event["interface_id"] = str(self.app.participant.instance_handle)
-        chain_event["primary_agent_id"] = ""
-        chain_event["specialized_agent_ids"] = ""
-        chain_event["function_id"] = function_id
-        chain_event["query_id"] = str(uuid.uuid4())
-        chain_event["timestamp"] = int(time.time() * 1000)
-        chain_event["event_type"] = "FUNCTION_CALL_COMPLETE"
-        chain_event["source_id"] = source_provider_id if source_provider_id else function_name
-        chain_event["target_id"] = str(self.app.participant.instance_handle)
-        chain_event["status"] = 0
-        
-        self.chain_event_writer.write(chain_event)
-        self.chain_event_writer.flush() 
\ No newline at end of file
+        self._publish_chain_event(
+            chain_id, call_id, function_id, "FUNCTION_CALL_COMPLETE",
+            source_id=source_provider_id if source_provider_id else function_name,
+            target_id=self.app.dds_guid
+        ) 
\ No newline at end of file
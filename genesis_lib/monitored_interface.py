@@ -23,13 +23,12 @@ Copyright (c) 2025, RTI & Jason Upchurch
 
 import logging
 import time
-import uuid
 import json
 import os
-from typing import Any, Dict, Optional, Callable, Coroutine
+from typing import Any, Dict, Optional, Callable, Coroutine, Union
 import rti.connextdds as dds
 from .interface import GenesisInterface
-from genesis_lib.utils import get_datamodel_path
+from genesis_lib.utils import get_type, next_event_id
 import asyncio
 import functools
 
@@ -44,6 +43,10 @@ EVENT_TYPE_MAP = {
     "INTERFACE_STATUS": 3      # Status event
 }
 
+# Lifecycle capabilities JSON; only the service and interface id are filled in per interface.
+# Byte-identical to json.dumps of the equivalent dict.
+_INTERFACE_CAPABILITIES_TEMPLATE = '{"interface_type": "INTERFACE", "service": %s, "interface_id": %s}'
+
 def monitor_method(event_type: str):
     """
     Decorator to add monitoring to interface methods.
@@ -60,11 +63,7 @@ def monitor_method(event_type: str):
             # Publish request monitoring event
             self.publish_monitoring_event(
                 event_type,
-                metadata={
-                    "interface_name": self.interface_name,
-                    "service_name": self.service_name,
-                    "provider_id": str(self.app.participant.instance_handle)
-                },
+                metadata=self._request_metadata_json,
                 call_data=request_data if event_type == "INTERFACE_REQUEST" else None,
                 result_data=request_data if event_type == "INTERFACE_RESPONSE" else None
             )
@@ -76,11 +75,7 @@ def monitor_method(event_type: str):
             if event_type == "INTERFACE_REQUEST" and result:
                 self.publish_monitoring_event(
                     "INTERFACE_RESPONSE",
-                    metadata={
-                        "interface_name": self.interface_name,
-                        "service_name": self.service_name,
-                        "provider_id": str(self.app.participant.instance_handle)
-                    },
+                    metadata=self._request_metadata_json,
                     result_data=result
                 )
             
@@ -102,6 +97,14 @@ class MonitoredInterface(GenesisInterface):
             interface_name: Name of the interface
             service_name: Name of the service this interface connects to
         """
+        # Monitoring entities start unset so close() is safe even if setup fails part-way
+        self.monitoring_topic = None
+        self.monitoring_publisher = None
+        self.monitoring_writer = None
+        self.component_lifecycle_writer = None
+        self.chain_event_writer = None
+        self.liveliness_writer = None
+        
         super().__init__(interface_name=interface_name, service_name=service_name)
         
         # Set up monitoring
@@ -126,7 +129,7 @@ class MonitoredInterface(GenesisInterface):
     def _setup_monitoring(self):
         """Set up DDS entities for monitoring"""
         # Get monitoring type from XML
-        self.monitoring_type = self.type_provider.type("genesis_lib", "MonitoringEvent")
+        self.monitoring_type = get_type("MonitoringEvent")
         
         # Create monitoring topic
         self.monitoring_topic = dds.DynamicData.Topic(
@@ -155,9 +158,9 @@ class MonitoredInterface(GenesisInterface):
 
         # Set up enhanced monitoring (V2)
         # Create topics for new monitoring types
-        self.component_lifecycle_type = self.type_provider.type("genesis_lib", "ComponentLifecycleEvent")
-        self.chain_event_type = self.type_provider.type("genesis_lib", "ChainEvent")
-        self.liveliness_type = self.type_provider.type("genesis_lib", "LivelinessUpdate")
+        self.component_lifecycle_type = get_type("ComponentLifecycleEvent")
+        self.chain_event_type = get_type("ChainEvent")
+        self.liveliness_type = get_type("LivelinessUpdate")
 
         # Create topics
         self.component_lifecycle_topic = dds.DynamicData.Topic(
@@ -198,23 +201,39 @@ class MonitoredInterface(GenesisInterface):
             qos=writer_qos
         )
     
+    @functools.cached_property
+    def _capabilities_json(self) -> str:
+        """Lifecycle capabilities JSON; its fields never change, so it is serialized once."""
+        return _INTERFACE_CAPABILITIES_TEMPLATE % (json.dumps(self.service_name), json.dumps(self.app.dds_guid))
+
+    @functools.cached_property
+    def _request_metadata_json(self) -> str:
+        """Request/response monitoring metadata JSON, serialized once per interface."""
+        return json.dumps({
+            "interface_name": self.interface_name,
+            "service_name": self.service_name,
+            "provider_id": self.app.dds_guid
+        })
+
     def _publish_discovery_event(self):
-        """Publish interface discovery event"""
-        interface_id = str(self.app.participant.instance_handle)
+        """Publish interface discovery event
+
+        The startup events are written as one burst and the lifecycle writer
+        is flushed once at the end rather than after every event.
+        """
+        interface_id = self.app.dds_guid
+        capabilities = self._capabilities_json
         
         # First publish node discovery event for the interface itself
         self.publish_component_lifecycle_event(
             previous_state="DISCOVERING",
             new_state="DISCOVERING",
             reason=f"Component {interface_id} joined domain",
-            capabilities=json.dumps({
-                "interface_type": "INTERFACE",
-                "service": self.service_name,
-                "interface_id": interface_id
-            }),
+            capabilities=capabilities,
             event_category="NODE_DISCOVERY",
             source_id=interface_id,
-            target_id="N/A"  # For node discovery of self, target is same as source
+            target_id="N/A",  # For node discovery of self, target is same as source
+            flush=False
         )
 
         # Publish legacy monitoring event
@@ -233,14 +252,11 @@ class MonitoredInterface(GenesisInterface):
             previous_state="JOINING",
             new_state="DISCOVERING",
             reason=f"{interface_id} JOINING -> DISCOVERING",
-            capabilities=json.dumps({
-                "interface_type": "INTERFACE",
-                "service": self.service_name,
-                "interface_id": interface_id
-            }),
+            capabilities=capabilities,
             event_category="STATE_CHANGE",
             source_id=interface_id,
-            target_id=interface_id  # For state changes, target is self
+            target_id=interface_id,  # For state changes, target is self
+            flush=False
         )
 
         # Transition to ready state
@@ -248,19 +264,17 @@ class MonitoredInterface(GenesisInterface):
             previous_state="DISCOVERING",
             new_state="READY",
             reason=f"{interface_id} DISCOVERING -> READY",
-            capabilities=json.dumps({
-                "interface_type": "INTERFACE",
-                "service": self.service_name,
-                "interface_id": interface_id
-            }),
+            capabilities=capabilities,
             event_category="STATE_CHANGE",
             source_id=interface_id,
-            target_id=interface_id  # For state changes, target is self
+            target_id=interface_id,  # For state changes, target is self
+            flush=False
         )
+        self.component_lifecycle_writer.flush()
     
     def publish_monitoring_event(self, 
                                event_type: str,
-                               metadata: Optional[Dict[str, Any]] = None,
+                               metadata: Optional[Union[Dict[str, Any], str]] = None,
                                call_data: Optional[Dict[str, Any]] = None,
                                result_data: Optional[Dict[str, Any]] = None,
                                status_data: Optional[Dict[str, Any]] = None,
@@ -270,7 +284,7 @@ class MonitoredInterface(GenesisInterface):
         
         Args:
             event_type: Type of event (INTERFACE_DISCOVERY, INTERFACE_REQUEST, etc.)
-            metadata: Additional metadata about the event
+            metadata: Additional metadata about the event, or an already-serialized JSON string
             call_data: Data about the request/call (if applicable)
             result_data: Data about the response/result (if applicable)
             status_data: Data about the interface status (if applicable)
@@ -280,7 +294,7 @@ class MonitoredInterface(GenesisInterface):
             event = dds.DynamicData(self.monitoring_type)
             
             # Set basic fields
-            event["event_id"] = str(uuid.uuid4())
+            event["event_id"] = next_event_id()
             event["timestamp"] = int(time.time() * 1000)
             event["event_type"] = EVENT_TYPE_MAP[event_type]
             event["entity_type"] = 0  # INTERFACE enum value
@@ -288,7 +302,7 @@ class MonitoredInterface(GenesisInterface):
             
             # Set optional fields
             if metadata:
-                event["metadata"] = json.dumps(metadata)
+                event["metadata"] = metadata if isinstance(metadata, str) else json.dumps(metadata)
             if call_data:
                 event["call_data"] = json.dumps(call_data)
             if result_data:
@@ -313,7 +327,8 @@ class MonitoredInterface(GenesisInterface):
                                        event_category: str = None,
                                        source_id: str = "",
                                        target_id: str = "",
-                                       connection_type: str = None):
+                                       connection_type: str = None,
+                                       flush: bool = True):
         """
         Publish a component lifecycle event for the interface.
         
@@ -328,6 +343,8 @@ class MonitoredInterface(GenesisInterface):
             source_id: Source ID of the event
             target_id: Target ID of the event
             connection_type: Type of connection for edge discovery events (optional)
+            flush: Flush the lifecycle writer after the write; callers publishing
+                a burst of events pass False and flush once at the end
         """
         try:
             # Map state strings to enum values
@@ -398,7 +415,8 @@ class MonitoredInterface(GenesisInterface):
                 event["connection_type"] = ""
 
             self.component_lifecycle_writer.write(event)
-            self.component_lifecycle_writer.flush()
+            if flush:
+                self.component_lifecycle_writer.flush()
             logger.debug(f"Published component lifecycle event: {previous_state} -> {new_state}")
         except Exception as e:
             logger.error(f"Error publishing component lifecycle event: {e}")
@@ -479,18 +497,24 @@ class MonitoredInterface(GenesisInterface):
             )
             
             # Close monitoring resources
-            if hasattr(self, 'monitoring_writer'):
+            if self.monitoring_writer is not None:
                 self.monitoring_writer.close()
-            if hasattr(self, 'monitoring_publisher'):
+                self.monitoring_writer = None
+            if self.monitoring_publisher is not None:
                 self.monitoring_publisher.close()
-            if hasattr(self, 'monitoring_topic'):
+                self.monitoring_publisher = None
+            if self.monitoring_topic is not None:
                 self.monitoring_topic.close()
-            if hasattr(self, 'component_lifecycle_writer'):
+                self.monitoring_topic = None
+            if self.component_lifecycle_writer is not None:
                 self.component_lifecycle_writer.close()
-            if hasattr(self, 'chain_event_writer'):
+                self.component_lifecycle_writer = None
+            if self.chain_event_writer is not None:
                 self.chain_event_writer.close()
-            if hasattr(self, 'liveliness_writer'):
+                self.chain_event_writer = None
+            if self.liveliness_writer is not None:
                 self.liveliness_writer.close()
+                self.liveliness_writer = None
             
             # Close base class resources
             await super().close()
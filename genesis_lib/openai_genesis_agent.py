@@ -23,11 +23,11 @@ import json
 import asyncio
 import time
 import traceback
-import uuid
 from openai import OpenAI
 from typing import Dict, Any, List, Optional
 
 from genesis_lib.monitored_agent import MonitoredAgent
+from genesis_lib.utils import next_event_id
 from genesis_lib.function_classifier import FunctionClassifier
 from genesis_lib.generic_function_client import GenericFunctionClient
 
@@ -259,8 +259,8 @@ Be friendly, professional, and maintain a helpful tone while being concise and c
             await self._ensure_functions_discovered()
             
             # Generate chain and call IDs for tracking
-            chain_id = str(uuid.uuid4())
-            call_id = str(uuid.uuid4())
+            chain_id = next_event_id()
+            call_id = next_event_id()
             
             # If no functions are available, proceed with basic response
             if not self.function_cache:
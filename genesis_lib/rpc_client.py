@@ -27,10 +27,28 @@ import rti.connextdds as dds
 import rti.rpc
 import asyncio
 import logging
+import itertools
 import json
 import time
 import uuid
 from typing import Any, Dict, Optional
+from genesis_lib.utils import wait_for_replier_match
+
+# Decode results with orjson when it is installed. Arguments are always encoded
+# with json.dumps: orjson would turn non-finite floats into null and rejects
+# non-str keys.
+try:
+    import orjson
+
+    def _json_loads(text: str):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # The service encodes with json.dumps, which writes non-finite floats
+            # as NaN/Infinity tokens; orjson rejects those, the stdlib accepts them
+            return json.loads(text)
+except ImportError:
+    _json_loads = json.loads
 
 # Set up logging
 logging.basicConfig(level=logging.WARNING,  # Reduce verbosity
@@ -64,6 +82,12 @@ class GenesisRPCClient:
         
         self.timeout = dds.Duration(seconds=timeout)
         
+        # Requests are filled and sent with no await in between, so one sample serves every call
+        self._request = self.get_request_type()(type="function")
+        # Call IDs are a per-client random prefix plus a counter, not a fresh uuid4 per call
+        self._call_id_prefix = f"call_{uuid.uuid4().hex[:8]}_"
+        self._call_ids = itertools.count(1)
+        
         # Common validation patterns
         self.validation_patterns = {
             "text": {
@@ -106,15 +130,13 @@ class GenesisRPCClient:
             TimeoutError: If service is not discovered within timeout
         """
         logger.info("Waiting for service discovery...")
-        start_time = time.time()
-        while self.requester.matched_replier_count == 0:
-            if time.time() - start_time > timeout_seconds:
-                raise TimeoutError(f"Service discovery timed out after {timeout_seconds} seconds")
-            await asyncio.sleep(0.1)
+        # Block in a worker thread on the DDS match statuses instead of polling
+        if not await asyncio.to_thread(wait_for_replier_match, self.requester, timeout_seconds):
+            raise TimeoutError(f"Service discovery timed out after {timeout_seconds} seconds")
             
         logger.info(f"Service discovered! Matched replier count: {self.requester.matched_replier_count}")
         return True
-    
+
     def validate_text(self, text: str, pattern_type: str = "text") -> None:
         """
         Validate text input using predefined patterns.
@@ -231,25 +253,20 @@ class GenesisRPCClient:
             ValueError: If the result JSON is invalid
         """
         # Create a unique ID for this function call
-        call_id = f"call_{uuid.uuid4().hex[:8]}"
+        call_id = f"{self._call_id_prefix}{next(self._call_ids)}"
         
         # Arguments are passed directly as kwargs
         arguments_json = json.dumps(kwargs)
         
-        # Create the request with function call
-        from genesis_lib.datamodel import FunctionCall
-        request = self.get_request_type()(
-            id=call_id,
-            type="function",
-            function=FunctionCall(
-                name=function_name,
-                arguments=arguments_json
-            )
-        )
+        # Fill the reusable request with this function call
+        request = self._request
+        request.id = call_id
+        request.function.name = function_name
+        request.function.arguments = arguments_json
         
-        logger.info(f"Calling remote function: {function_name}")
-        logger.debug(f"Call ID: {call_id}")
-        logger.debug(f"Arguments: {arguments_json}")
+        logger.info("Calling remote function: %s", function_name)
+        logger.debug("Call ID: %s", call_id)
+        logger.debug("Arguments: %s", arguments_json)
         
         # Send the request
         request_id = self.requester.send_request(request)
@@ -257,11 +274,13 @@ class GenesisRPCClient:
         
         try:
             # Wait for and receive the reply
-            logger.debug(f"Waiting for reply with timeout of {self.timeout.nanosec / 1e9} seconds")
-            replies = self.requester.receive_replies(
+            logger.debug("Waiting for reply with timeout of %s seconds", self.timeout.nanosec / 1e9)
+            # Await the reply on the requester's native async wait so the event loop is not blocked
+            replied = await self.requester.wait_for_replies_async(
                 max_wait=self.timeout,
                 related_request_id=request_id
             )
+            replies = self.requester.take_replies(request_id) if replied else []
             
             if not replies:
                 logger.error("No reply received within timeout period")
@@ -269,13 +288,13 @@ class GenesisRPCClient:
             
             # Process the reply
             reply = replies[0].data
-            logger.debug(f"Received reply: success={reply.success}, error_message='{reply.error_message}'")
+            logger.debug("Received reply: success=%s, error_message='%s'", reply.success, reply.error_message)
             
             if reply.success:
                 # Parse the result JSON
                 try:
-                    result = json.loads(reply.result_json)
-                    logger.info(f"Function {function_name} returned: {result}")
+                    result = _json_loads(reply.result_json)
+                    logger.info("Function %s returned: %s", function_name, result)
                     return result
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing result JSON: {str(e)}")
@@ -46,6 +46,9 @@ logging.basicConfig(level=logging.DEBUG,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('GenesisRPCService')
 
+# Maximum wait per receive_requests() call in the service loop, built once
+REQUEST_WAIT = dds.Duration(3600)
+
 class GenesisRPCService:
     """
     Base class for all Genesis RPC services.
@@ -169,7 +172,7 @@ class GenesisRPCService:
         try:
             while True:
                 logger.debug("Waiting for next request...")
-                requests = self.replier.receive_requests(max_wait=dds.Duration(3600))
+                requests = self.replier.receive_requests(max_wait=REQUEST_WAIT)
                 
                 for request_sample in requests:
                     request = request_sample.data
@@ -177,7 +180,7 @@ class GenesisRPCService:
                     function_name = request.function.name
                     arguments_json = request.function.arguments
                     
-                    logger.info(f"Received request: id={request.id}, function={function_name}, args={arguments_json}")
+                    logger.info("Received request: id=%s, function=%s, args=%s", request.id, function_name, arguments_json)
                     
                     reply = None
                     
@@ -197,7 +200,7 @@ class GenesisRPCService:
                                     jsonschema.validate(args_data, schema)
                                 
                                 # Call the function with the parsed arguments and request info
-                                logger.debug(f"Calling {function_name} with args={args_data}")
+                                logger.debug("Calling %s with args=%s", function_name, args_data)
                                 
                                 # Add request_info to the function call
                                 args_data["request_info"] = request_info
@@ -211,7 +214,7 @@ class GenesisRPCService:
                                     
                                 # Convert result to JSON
                                 result_json = json.dumps(result)
-                                logger.info(f"Function {function_name} returned: {result_json}")
+                                logger.info("Function %s returned: %s", function_name, result_json)
                                 
                                 reply = self.get_reply_type()(
                                     result_json=result_json,
@@ -255,7 +258,7 @@ class GenesisRPCService:
                             error_message="Internal service error: No reply created"
                         )
                         
-                    logger.info(f"Sending reply: success={reply.success}")
+                    logger.info("Sending reply: success=%s", reply.success)
                     self.replier.send_reply(reply, request_sample.info)
 
         except KeyboardInterrupt:
@@ -4,9 +4,14 @@ Utility modules for the Genesis library
 
 from .openai_utils import convert_functions_to_openai_schema, generate_response_with_functions
 from .function_utils import call_function_thread_safe, find_function_by_name, filter_functions_by_relevance
+from .event_ids import next_event_id
 from ..datamodel import *
 
+import asyncio
+import functools
+import math
 import os
+import time
 import rti.connextdds as dds
 
 __all__ = [
@@ -14,7 +19,13 @@ __all__ = [
     'call_function_thread_safe', 
     'find_function_by_name', 
     'filter_functions_by_relevance',
-    'generate_response_with_functions'
+    'generate_response_with_functions',
+    'new_event_loop',
+    'get_type_provider',
+    'get_type',
+    'next_event_id',
+    'wait_duration',
+    'wait_for_replier_match'
 ]
 
 def get_datamodel_path():
@@ -26,6 +37,92 @@ def get_datamodel_path():
     """
     return os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "datamodel.xml")
 
+@functools.lru_cache(maxsize=1)
+def get_type_provider():
+    """
+    Get the process-wide QosProvider for datamodel.xml.
+    
+    The XML is parsed once and the provider is shared by every component that
+    needs to resolve Genesis types.
+    
+    Returns:
+        dds.QosProvider: The shared provider for the Genesis datamodel
+    """
+    return dds.QosProvider(get_datamodel_path())
+
+@functools.lru_cache(maxsize=None)
+def get_type(type_name):
+    """
+    Resolve a genesis_lib type from the shared provider, once per process.
+    
+    Args:
+        type_name: Name of the type within the genesis_lib module of datamodel.xml
+        
+    Returns:
+        dds.DynamicType: The resolved type, shared by every caller
+    """
+    return get_type_provider().type("genesis_lib", type_name)
+
+@functools.lru_cache(maxsize=1024)
+def _duration_ms(milliseconds: int):
+    """Return a shared dds.Duration for a whole number of milliseconds."""
+    return dds.Duration(seconds=milliseconds // 1000, nanoseconds=(milliseconds % 1000) * 1_000_000)
+
+def wait_duration(seconds: float):
+    """
+    WaitSet timeout for `seconds`, rounded up to the millisecond.
+
+    Rounding up means a wait never returns just short of its deadline and
+    needs a second wake-up, and lets the Duration objects be cached.
+    """
+    return _duration_ms(max(0, math.ceil(seconds * 1000)))
+
+def wait_for_replier_match(requester, timeout=None, cancel=None) -> bool:
+    """
+    Block until an RPC requester has matched at least one replier.
+
+    Waits on a WaitSet attached to the requester's match statuses rather than
+    polling, so it returns as soon as discovery completes.
+
+    Args:
+        requester: The rti.rpc.Requester to watch
+        timeout: Maximum seconds to wait, or None to wait indefinitely
+        cancel: Optional dds.GuardCondition that abandons the wait when triggered
+
+    Returns:
+        bool: True once a replier is matched, False on timeout or cancellation
+    """
+    reader_condition = dds.StatusCondition(requester.reply_datareader)
+    reader_condition.enabled_statuses = dds.StatusMask.SUBSCRIPTION_MATCHED
+    writer_condition = dds.StatusCondition(requester.request_datawriter)
+    writer_condition.enabled_statuses = dds.StatusMask.PUBLICATION_MATCHED
+    waitset = dds.WaitSet()
+    waitset.attach_condition(reader_condition)
+    waitset.attach_condition(writer_condition)
+    if cancel is not None:
+        waitset.attach_condition(cancel)
+
+    # Monotonic deadline computed once, immune to wall-clock adjustments
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while requester.matched_replier_count == 0:
+        if deadline is None:
+            max_wait = dds.Duration.infinite
+        else:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            max_wait = wait_duration(remaining)
+        try:
+            waitset.wait(max_wait)
+        except dds.TimeoutError:
+            pass
+        if cancel is not None and cancel.trigger_value:
+            return False
+        # Reading the statuses clears their changed flags so the conditions re-arm
+        _ = requester.reply_datareader.subscription_matched_status
+        _ = requester.request_datawriter.publication_matched_status
+    return True
+
 def load_datamodel():
     """
     Load the Python data model.
@@ -41,4 +138,23 @@ def load_datamodel():
         return import_module('genesis_lib.datamodel')
     except ImportError as e:
         print(f"Error importing data model: {e}")
-        raise 
\ No newline at end of file
+        raise 
+
+def new_event_loop():
+    """
+    Create a fresh event loop for the synchronous wrappers around async methods.
+
+    When the GENESIS_USE_UVLOOP environment variable is set to "1" and uvloop is
+    installed, a uvloop loop is returned; otherwise the stdlib loop is used.
+    The global event loop policy is left untouched.
+
+    Returns:
+        asyncio.AbstractEventLoop: A new, not-yet-running event loop
+    """
+    if os.environ.get("GENESIS_USE_UVLOOP") == "1":
+        try:
+            import uvloop
+            return uvloop.new_event_loop()
+        except ImportError:
+            pass
+    return asyncio.new_event_loop()
@@ -0,0 +1,34 @@
+"""
+Unique IDs for published events and requests.
+
+Only the standard library is used here, so the generator can be loaded and
+tested without Connext.
+"""
+
+import itertools
+import os
+import uuid
+
+# Random per-process prefix plus a counter; regenerated in forked children so IDs stay unique
+_event_id_prefix = uuid.uuid4().hex
+_event_id_counter = itertools.count(1)
+
+def _reset_event_ids():
+    global _event_id_prefix, _event_id_counter
+    _event_id_prefix = uuid.uuid4().hex
+    _event_id_counter = itertools.count(1)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_event_ids)
+
+def next_event_id():
+    """
+    Get a unique ID for a published event or request.
+    
+    Cheaper than str(uuid.uuid4()) per call: the random part is drawn once per
+    process and only a counter advances afterwards.
+    
+    Returns:
+        str: An ID unique across processes for the lifetime of this one
+    """
+    return f"{_event_id_prefix}-{next(_event_id_counter)}"
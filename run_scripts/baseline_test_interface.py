@@ -36,9 +36,7 @@ async def main():
         interface = TracingMonitoredChatGPTInterface()
 
         logger.info("🔍 TRACE: Waiting for agent discovery...")
-        # Run wait_for_agent in a thread pool since it's not async
-        loop = asyncio.get_event_loop()
-        if not await loop.run_in_executor(None, interface.wait_for_agent):
+        if not await interface.wait_for_agent():
             logger.error("❌ TRACE: No agent found, exiting")
             sys.exit(1)
 
@@ -47,8 +45,7 @@ async def main():
         logger.info(f"📤 TRACE: Sending test message: '{test_message}'")
 
         # Send the request using the existing interface method
-        # Run send_request in a thread pool since it's not async
-        reply = await loop.run_in_executor(None, interface.send_request, {'message': test_message})
+        reply = await interface.send_request({'message': test_message})
         if reply:
             logger.info(f"📥 TRACE: Received reply: {reply}")
             if reply.get('status') != 0:
@@ -65,7 +62,7 @@ async def main():
     finally:
         if interface:
             logger.info("🧹 TRACE: Cleaning up interface")
-            interface.close()
+            await interface.close()
         logger.info(f"🏁 TRACE: BaselineTestInterface ending with exit code: {exit_code}")
         sys.exit(exit_code)
 
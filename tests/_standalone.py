@@ -0,0 +1,23 @@
+"""
+Load stdlib-only genesis_lib modules without importing the genesis_lib package.
+
+genesis_lib/__init__.py imports every component, and Connext with them, so
+tests for the pure helpers load their module straight from its file.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "genesis_lib"
+
+
+def load_module(relative_path):
+    """Load genesis_lib/<relative_path> once per test session and return it."""
+    name = "_standalone." + relative_path[:-len(".py")].replace("/", ".")
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, _PACKAGE_DIR / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
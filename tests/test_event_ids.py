@@ -0,0 +1,51 @@
+"""
+Tests for next_event_id: unique within a process and across a fork.
+
+The generator is stdlib-only, so it is loaded without the genesis_lib package
+and runs without Connext.
+"""
+
+import os
+
+import pytest
+
+from _standalone import load_module
+
+next_event_id = load_module("utils/event_ids.py").next_event_id
+
+
+def _prefix(event_id):
+    return event_id.rsplit("-", 1)[0]
+
+
+def test_event_ids_are_unique_within_a_process():
+    ids = [next_event_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert len({_prefix(event_id) for event_id in ids}) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_repeat_parent_ids():
+    before_fork = next_event_id()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: report its ids to the parent and exit without running pytest teardown
+        try:
+            os.close(read_fd)
+            os.write(write_fd, "\n".join(next_event_id() for _ in range(100)).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        child_ids = pipe.read().decode().split("\n")
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    parent_ids = [next_event_id() for _ in range(100)]
+    assert len(child_ids) == 100
+    assert len(set(child_ids)) == 100
+    assert not set(child_ids) & set(parent_ids)
+    assert {_prefix(event_id) for event_id in child_ids} != {_prefix(before_fork)}
+    assert _prefix(parent_ids[0]) == _prefix(before_fork)
@@ -0,0 +1,52 @@
+"""
+Tests for FunctionRegistry.wait_for_discovery across event loops.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("rti.connextdds")
+
+from genesis_lib.function_discovery import FunctionRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = FunctionRegistry(enable_discovery_listener=False)
+    yield registry
+    registry.close()
+
+
+def test_waiters_on_different_loops_are_all_woken(registry):
+    results = []
+    waiting = threading.Barrier(3)
+
+    def wait_on_new_loop():
+        async def wait():
+            waiting.wait()
+            await registry.wait_for_discovery(timeout_seconds=5)
+            results.append(threading.current_thread().name)
+        asyncio.run(wait())
+
+    waiters = [threading.Thread(target=wait_on_new_loop, name=f"waiter-{n}") for n in range(2)]
+    for waiter in waiters:
+        waiter.start()
+    waiting.wait()
+    # Give both coroutines time to park before discovery is signalled
+    threading.Event().wait(0.2)
+    registry._notify_discovery_waiters()
+    for waiter in waiters:
+        waiter.join(5)
+    assert sorted(results) == ["waiter-0", "waiter-1"]
+
+
+def test_a_later_loop_can_wait_after_a_timeout(registry):
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(registry.wait_for_discovery(timeout_seconds=0.05))
+    assert registry._discovery_waiters == []
+
+    registry._notify_discovery_waiters()
+    # A fresh loop returns at once instead of touching the first loop's state
+    asyncio.run(registry.wait_for_discovery(timeout_seconds=1))
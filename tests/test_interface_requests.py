@@ -0,0 +1,168 @@
+"""
+Tests for GenesisInterface's requester thread: timeouts, pipelined requests,
+reconnects and late replies.
+
+These run against a real DDS participant on the default domain, so each test
+uses its own service names.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+
+import pytest
+
+dds = pytest.importorskip("rti.connextdds")
+rpc = pytest.importorskip("rti.rpc")
+
+from genesis_lib.interface import GenesisInterface
+from genesis_lib.utils import get_type_provider
+
+
+def _type(name):
+    return get_type_provider().type("genesis_lib", name)
+
+
+class _EchoReplier:
+    """Answers each InterfaceAgentRequest with its own message after `delay` seconds."""
+    def __init__(self, participant, service_name, delay=0.0):
+        self.replier = rpc.Replier(
+            request_type=_type("InterfaceAgentRequest"),
+            reply_type=_type("InterfaceAgentReply"),
+            participant=participant,
+            service_name=service_name
+        )
+        self.delay = delay
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        reply_type = _type("InterfaceAgentReply")
+        while not self._stop.is_set():
+            try:
+                requests = self.replier.receive_requests(max_wait=dds.Duration(0, 100_000_000))
+            except dds.TimeoutError:
+                continue
+            for request in requests:
+                if not request.info.valid:
+                    continue
+                if self._stop.wait(self.delay):
+                    return
+                reply = dds.DynamicData(reply_type)
+                reply["message"] = request.data["message"]
+                reply["status"] = 0
+                reply["conversation_id"] = request.data["conversation_id"]
+                self.replier.send_reply(reply, request.info)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.replier.close()
+
+
+def _service_name(label):
+    return f"TestInterface_{label}_{uuid.uuid4().hex[:8]}"
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_pipelined_requests_are_matched_to_their_callers():
+    async def scenario():
+        interface = GenesisInterface("PipelineTestInterface", "PipelineTest")
+        service = _service_name("pipeline")
+        replier = _EchoReplier(interface.app.participant, service)
+        try:
+            assert await interface.connect_to_agent(service, timeout_seconds=10.0)
+            replies = await asyncio.gather(*(
+                interface.send_request({"message": f"request-{i}", "conversation_id": str(i)})
+                for i in range(20)
+            ))
+            assert [reply["message"] for reply in replies] == [f"request-{i}" for i in range(20)]
+            assert [reply["conversation_id"] for reply in replies] == [str(i) for i in range(20)]
+        finally:
+            replier.close()
+            await interface.close()
+
+    _run(scenario())
+
+
+def test_request_times_out_to_none():
+    async def scenario():
+        interface = GenesisInterface("TimeoutTestInterface", "TimeoutTest")
+        service = _service_name("timeout")
+        replier = _EchoReplier(interface.app.participant, service, delay=2.0)
+        try:
+            assert await interface.connect_to_agent(service, timeout_seconds=10.0)
+            assert await interface.send_request({"message": "slow", "conversation_id": "1"}, timeout_seconds=0.2) is None
+        finally:
+            replier.close()
+            await interface.close()
+
+    _run(scenario())
+
+
+def test_reconnect_with_requests_in_flight(caplog):
+    async def scenario():
+        interface = GenesisInterface("ReconnectTestInterface", "ReconnectTest")
+        slow_service = _service_name("slow")
+        fast_service = _service_name("fast")
+        slow = _EchoReplier(interface.app.participant, slow_service, delay=1.0)
+        fast = _EchoReplier(interface.app.participant, fast_service)
+        try:
+            assert await interface.connect_to_agent(slow_service, timeout_seconds=10.0)
+            in_flight = [
+                asyncio.ensure_future(interface.send_request(
+                    {"message": f"old-{i}", "conversation_id": str(i)}, timeout_seconds=5.0))
+                for i in range(5)
+            ]
+            # Let the requester thread write them before the reconnect
+            await asyncio.sleep(0.2)
+
+            assert await interface.connect_to_agent(fast_service, timeout_seconds=10.0)
+
+            # Requests to the replaced requester resolve instead of hanging
+            old_replies = await asyncio.wait_for(asyncio.gather(*in_flight), timeout=2.0)
+            assert old_replies == [None] * 5
+
+            replies = await asyncio.gather(*(
+                interface.send_request({"message": f"new-{i}", "conversation_id": str(i)})
+                for i in range(5)
+            ))
+            assert [reply["message"] for reply in replies] == [f"new-{i}" for i in range(5)]
+        finally:
+            slow.close()
+            fast.close()
+            await interface.close()
+
+    with caplog.at_level(logging.ERROR, logger="genesis_lib.interface"):
+        _run(scenario())
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+@pytest.mark.skipif(not hasattr(time, "pthread_getcpuclockid"), reason="requires per-thread CPU clocks")
+def test_requester_thread_idles_after_a_late_reply():
+    async def scenario():
+        interface = GenesisInterface("LateReplyTestInterface", "LateReplyTest")
+        service = _service_name("late")
+        replier = _EchoReplier(interface.app.participant, service, delay=0.5)
+        try:
+            assert await interface.connect_to_agent(service, timeout_seconds=10.0)
+            assert await interface.send_request({"message": "late", "conversation_id": "1"}, timeout_seconds=0.1) is None
+            # Let the reply arrive after its request has already resolved
+            await asyncio.sleep(1.0)
+
+            clock = time.pthread_getcpuclockid(interface._request_worker.ident)
+            start = time.clock_gettime(clock)
+            await asyncio.sleep(0.5)
+            # A thread woken over and over by the unread reply would use most of this window
+            assert time.clock_gettime(clock) - start < 0.05
+        finally:
+            replier.close()
+            await interface.close()
+
+    _run(scenario())
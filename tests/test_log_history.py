@@ -0,0 +1,57 @@
+"""
+Tests for the helpers that build and query LogSubscriber's stored logs.
+
+They are stdlib-only, so they are loaded without the genesis_lib package and
+run without Connext.
+"""
+
+import logging
+from types import SimpleNamespace
+
+from _standalone import load_module
+
+log_buffers = load_module("log_buffers.py")
+
+
+def _log_message(n, level=logging.INFO, source="source"):
+    """Stand-in for a received LogMessage; log dictionaries are read from it by attribute."""
+    return SimpleNamespace(
+        log_id=f"{source}-{n}", timestamp=n, source_id=source, source_name=source,
+        level=level, level_name=logging.getLevelName(level), message=f"message {n}",
+        logger_name="test", thread_id=1, thread_name="MainThread",
+        file_name="test.py", line_number=n, function_name="test"
+    )
+
+
+def test_entries_are_dictionaries_of_every_field():
+    entry, = log_buffers._log_entries([_log_message(0, logging.WARNING)])
+    assert list(entry) == list(log_buffers._LOG_FIELDS)
+    assert entry["message"] == "message 0"
+    assert entry["level_name"] == "WARNING"
+
+
+def test_append_bounded_keeps_the_newest_logs():
+    logs = []
+    for start in range(0, 12, 4):
+        log_buffers._append_bounded(logs, list(range(start, start + 4)), 5)
+        assert len(logs) <= 5
+    assert logs == list(range(7, 12))
+
+
+def test_select_filters_by_level_and_source():
+    logs = log_buffers._log_entries([
+        _log_message(0, logging.DEBUG, "a"),
+        _log_message(1, logging.WARNING, "a"),
+        _log_message(2, logging.ERROR, "b"),
+        _log_message(3, logging.INFO, "b"),
+    ])
+    select = log_buffers._select_logs
+    assert select(logs, level_filter=logging.WARNING) == logs[1:3]
+    assert select(logs, source_filter="b") == logs[2:]
+    assert select(logs, level_filter=logging.INFO, source_filter="a") == [logs[1]]
+
+
+def test_select_keeps_the_newest_matches_in_order():
+    logs = log_buffers._log_entries(_log_message(n) for n in range(10))
+    selected = log_buffers._select_logs(logs, max_count=3, level_filter=logging.INFO)
+    assert [log["line_number"] for log in selected] == [7, 8, 9]
@@ -0,0 +1,61 @@
+"""
+Tests that the typed LogMessage struct interoperates with the XML LogMessage type.
+"""
+
+import time
+import uuid
+
+import pytest
+
+dds = pytest.importorskip("rti.connextdds")
+idl = pytest.importorskip("rti.idl")
+
+from genesis_lib.datamodel import LogMessage
+from genesis_lib.utils import get_type
+
+
+def test_typed_log_message_has_the_xml_type_name():
+    assert idl.get_type_support(LogMessage).dynamic_type.name == get_type("LogMessage").name
+
+
+def test_dynamic_data_reader_receives_typed_log_messages():
+    topic_name = f"GenesisLogsTypeTest_{uuid.uuid4().hex[:8]}"
+    qos = dds.QosProvider.default.datareader_qos
+    qos.reliability.kind = dds.ReliabilityKind.RELIABLE
+    writer_qos = dds.QosProvider.default.datawriter_qos
+    writer_qos.reliability.kind = dds.ReliabilityKind.RELIABLE
+
+    # Separate participants, as a topic name is bound to one type per participant
+    typed_participant = dds.DomainParticipant(0)
+    dynamic_participant = dds.DomainParticipant(0)
+    try:
+        writer = dds.DataWriter(
+            dds.Publisher(typed_participant),
+            dds.Topic(typed_participant, topic_name, LogMessage),
+            qos=writer_qos
+        )
+        reader = dds.DynamicData.DataReader(
+            dds.Subscriber(dynamic_participant),
+            dds.DynamicData.Topic(dynamic_participant, topic_name, get_type("LogMessage")),
+            qos=qos
+        )
+
+        deadline = time.monotonic() + 10
+        while writer.publication_matched_status.current_count == 0:
+            assert time.monotonic() < deadline, "DynamicData reader did not match the typed writer"
+            time.sleep(0.05)
+
+        writer.write(LogMessage(log_id="source-1", level=20, level_name="INFO", message="hello"))
+
+        samples = []
+        while not samples:
+            assert time.monotonic() < deadline, "No sample reached the DynamicData reader"
+            samples = [data for data, info in reader.take() if info.valid]
+            time.sleep(0.05)
+        assert samples[0]["message"] == "hello"
+        assert samples[0]["level_name"] == "INFO"
+    finally:
+        dynamic_participant.close_contained_entities()
+        dynamic_participant.close()
+        typed_participant.close_contained_entities()
+        typed_participant.close()
@@ -0,0 +1,90 @@
+"""
+Tests for LogPublisher shutdown and DDSLogHandler's load shedding.
+"""
+
+import logging
+import time
+
+import pytest
+
+pytest.importorskip("rti.connextdds")
+
+from genesis_lib.genesis_monitoring import DDSLogHandler, LOG_RING_HIGH_WATERMARK, LogPublisher
+
+
+class _RecordingPublisher:
+    """Stands in for LogPublisher: reports a settable backlog and records what is written."""
+    def __init__(self):
+        self.backlog = 0
+        self.written = []
+
+    def publish_log(self, level, message, logger_name=""):
+        self.written.append((level, message))
+
+    def _fill_and_enqueue(self, level, message, *rest):
+        self.written.append((level, message))
+        self.caller_fields = rest
+
+
+def _record(level, message):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_publisher_close_while_idle_stops_the_worker():
+    publisher = LogPublisher(source_id="close-test", source_name="close-test")
+    # Let the worker find the ring empty and park
+    time.sleep(0.2)
+    start = time.monotonic()
+    publisher.close()
+    assert not publisher.publish_thread.is_alive()
+    assert time.monotonic() - start < 1.0
+
+
+def test_handler_sheds_below_warning_while_congested():
+    publisher = _RecordingPublisher()
+    handler = DDSLogHandler(publisher, source_id="source", source_name="source")
+
+    publisher.backlog = LOG_RING_HIGH_WATERMARK + 1
+    handler.emit(_record(logging.DEBUG, "debug"))
+    handler.emit(_record(logging.INFO, "info"))
+    assert publisher.written == []
+    assert handler.shed_count == 2
+
+    # WARNING and above still go through, preceded by the count of shed records
+    handler.emit(_record(logging.WARNING, "warning"))
+    (report_level, report), warning = publisher.written
+    assert report_level == logging.WARNING
+    assert "Dropped 2 log records" in report
+    assert warning == (logging.WARNING, "warning")
+    assert handler.shed_count == 0
+
+
+def test_handler_reports_shed_records_once_uncongested():
+    publisher = _RecordingPublisher()
+    handler = DDSLogHandler(publisher, source_id="source", source_name="source")
+
+    publisher.backlog = LOG_RING_HIGH_WATERMARK + 1
+    handler.emit(_record(logging.INFO, "shed"))
+    publisher.backlog = 0
+    handler.emit(_record(logging.INFO, "kept"))
+    handler.emit(_record(logging.INFO, "kept again"))
+
+    (report_level, report), first, second = publisher.written
+    assert report_level == logging.WARNING
+    assert "Dropped 1 log records" in report
+    assert first == (logging.INFO, "kept")
+    assert second == (logging.INFO, "kept again")
+    assert handler.shed_count == 0
+
+
+def test_handler_publishes_records_without_caller_info():
+    publisher = _RecordingPublisher()
+    handler = DDSLogHandler(publisher, source_id="source", source_name="source")
+
+    record = logging.makeLogRecord({
+        "name": "test", "levelno": logging.WARNING, "levelname": "WARNING",
+        "msg": "hand-built", "filename": None, "funcName": None
+    })
+    handler.emit(record)
+    assert publisher.written == [(logging.WARNING, "hand-built")]
+    assert None not in publisher.caller_fields
@@ -0,0 +1,78 @@
+"""
+Tests for the bounded log ring between DDSLogHandler and LogPublisher.
+
+The ring is stdlib-only, so it is loaded without the genesis_lib package and
+runs without Connext.
+"""
+
+import threading
+
+from _standalone import load_module
+
+_LogRing = load_module("log_buffers.py")._LogRing
+
+
+def test_ring_drops_and_counts_when_full():
+    ring = _LogRing(capacity=3)
+    assert [ring.try_push(n) for n in range(5)] == [True, True, True, False, False]
+    assert ring.dropped_count == 2
+    assert len(ring) == 3
+    assert ring.pop_batch(2) == [0, 1]
+    assert ring.try_push(5)
+    assert ring.pop_batch() == [2, 5]
+    assert ring.pop_batch() == []
+    assert ring.dropped_count == 2
+
+
+def test_ring_counts_every_push_from_concurrent_producers():
+    ring = _LogRing(capacity=500)
+    start = threading.Barrier(8)
+
+    def produce():
+        start.wait()
+        for n in range(1000):
+            ring.try_push(n)
+
+    producers = [threading.Thread(target=produce) for _ in range(8)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    assert len(ring) == 500
+    assert ring.dropped_count == 8 * 1000 - 500
+
+
+def test_ring_wait_times_out_when_empty():
+    ring = _LogRing(capacity=3)
+    assert ring.wait(timeout=0.01) is False
+
+
+def test_ring_wait_returns_at_once_if_items_are_queued():
+    ring = _LogRing(capacity=3)
+    ring.try_push("item")
+    assert ring.wait(timeout=0) is True
+
+
+def test_ring_push_and_wake_release_a_waiting_consumer():
+    ring = _LogRing(capacity=3)
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(ring.wait(timeout=5)))
+    consumer.start()
+    ring.try_push("item")
+    consumer.join(5)
+    assert results == [True]
+
+    consumer = threading.Thread(target=lambda: results.append(ring.wait(timeout=5)))
+    ring.pop_batch()
+    consumer.start()
+    ring.wake()
+    consumer.join(5)
+    assert results == [True, True]
+
+
+def test_wake_before_wait_is_not_lost():
+    ring = _LogRing(capacity=3)
+    # Shutdown lands after the consumer found the ring empty but before it parks
+    ring.wake()
+    assert ring.wait(timeout=0) is True
+    assert ring.wait(timeout=0) is True
@@ -0,0 +1,83 @@
+"""
+Tests for LogSubscriber's stored logs and callback dispatch.
+
+Samples are fed straight into the subscriber's receive handler; the DDS reader
+it creates is not exercised.
+"""
+
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("rti.connextdds")
+
+from genesis_lib import genesis_monitoring
+from genesis_lib.genesis_monitoring import LogSubscriber
+
+
+def _log_message(n, level=logging.INFO, source="source"):
+    """Stand-in for a received LogMessage; the subscriber reads samples by attribute."""
+    return SimpleNamespace(
+        log_id=f"{source}-{n}", timestamp=n, source_id=source, source_name=source,
+        level=level, level_name=logging.getLevelName(level), message=f"message {n}",
+        logger_name="test", thread_id=1, thread_name="MainThread",
+        file_name="test.py", line_number=n, function_name="test"
+    )
+
+
+def test_logs_are_dictionaries():
+    subscriber = LogSubscriber()
+    try:
+        subscriber._on_log_received(_log_message(0))
+        subscriber._on_log_received(_log_message(1, logging.WARNING))
+        assert subscriber.logs[0]["message"] == "message 0"
+        assert subscriber.logs[1]["level_name"] == "WARNING"
+        assert subscriber.get_logs(level_filter=logging.WARNING) == [subscriber.logs[1]]
+    finally:
+        subscriber.close()
+
+
+def test_history_keeps_the_newest_logs(monkeypatch):
+    monkeypatch.setattr(genesis_monitoring, "LOG_HISTORY_SIZE", 5)
+    subscriber = LogSubscriber()
+    try:
+        for n in range(12):
+            subscriber._on_log_received(_log_message(n))
+        assert [log["line_number"] for log in subscriber.get_logs()] == list(range(7, 12))
+        assert [log["line_number"] for log in subscriber.get_logs(max_count=2)] == [10, 11]
+        # logs stays a list that callers can slice while holding logs_lock
+        with subscriber.logs_lock:
+            assert [log["line_number"] for log in subscriber.logs[-2:]] == [10, 11]
+    finally:
+        subscriber.close()
+
+
+def test_callback_runs_before_the_handler_returns():
+    seen = []
+    subscriber = LogSubscriber(callback=lambda log: seen.append((log["message"], len(subscriber.get_logs()))))
+    try:
+        subscriber._on_log_batch_received([_log_message(0), _log_message(1)])
+        assert [message for message, _ in seen] == ["message 0", "message 1"]
+        # Every log in the batch is stored before the callbacks run
+        assert all(count == 2 for _, count in seen)
+    finally:
+        subscriber.close()
+
+
+def test_threaded_callback_runs_off_the_receiving_thread():
+    done = threading.Event()
+    threads = []
+
+    def callback(log):
+        threads.append(threading.current_thread())
+        done.set()
+
+    subscriber = LogSubscriber(callback=callback, threaded_callback=True)
+    try:
+        subscriber._on_log_received(_log_message(0))
+        assert done.wait(5)
+        assert threads[0] is not threading.current_thread()
+    finally:
+        subscriber.close()
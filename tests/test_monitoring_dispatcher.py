@@ -0,0 +1,94 @@
+"""
+Tests for _MonitoringDispatcher's write ordering and gated channels.
+
+Channels write to a recording stand-in rather than a DDS writer; match state
+is driven through set_subscribed as the publication-matched listener would.
+"""
+
+import pytest
+
+pytest.importorskip("rti.connextdds")
+
+from genesis_lib import monitored_agent
+from genesis_lib.monitored_agent import _MonitoringChannel, _MonitoringDispatcher
+from genesis_lib.utils import get_type
+
+_FIELDS = ("chain_id", "call_id")
+
+
+class _RecordingWriter:
+    """Stands in for a DataWriter: records the fields of each written sample and counts flushes."""
+    def __init__(self):
+        self.written = []
+        self.flushes = 0
+
+    def write(self, sample):
+        self.written.append(tuple(sample[name] for name in _FIELDS))
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _channel(gated):
+    writer = _RecordingWriter()
+    return writer, _MonitoringChannel(writer, get_type("ChainEvent"), _FIELDS, gated=gated, source_id="agent")
+
+
+def _events(start, stop):
+    return [(f"chain-{n}", f"call-{n}") for n in range(start, stop)]
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = _MonitoringDispatcher("TestMonitoringDispatcher")
+    yield dispatcher
+    dispatcher.close()
+
+
+def test_ungated_channel_writes_in_order_and_flushes_on_close():
+    writer, channel = _channel(gated=False)
+    dispatcher = _MonitoringDispatcher("TestMonitoringDispatcher")
+    for values in _events(0, 200):
+        dispatcher.submit(channel, values)
+    dispatcher.close()
+    assert writer.written == _events(0, 200)
+    assert writer.flushes == 1
+
+
+def test_gated_channel_holds_events_until_first_match(dispatcher):
+    writer, channel = _channel(gated=True)
+    for values in _events(0, 10):
+        dispatcher.submit(channel, values)
+    assert list(channel.pending) == _events(0, 10)
+
+    dispatcher.set_subscribed(channel, True)
+    assert not channel.pending
+    for values in _events(10, 15):
+        dispatcher.submit(channel, values)
+    dispatcher.close()
+    assert writer.written == _events(0, 15)
+
+
+def test_pending_limit_keeps_the_newest_events(monkeypatch, dispatcher):
+    monkeypatch.setattr(monitored_agent, "MONITORING_PENDING_LIMIT", 5)
+    writer, channel = _channel(gated=True)
+    for values in _events(0, 12):
+        dispatcher.submit(channel, values)
+    dispatcher.set_subscribed(channel, True)
+    dispatcher.close()
+    assert writer.written == _events(7, 12)
+
+
+def test_events_are_held_while_every_monitor_is_unmatched(dispatcher):
+    writer, channel = _channel(gated=True)
+    dispatcher.set_subscribed(channel, True)
+    dispatcher.submit(channel, ("chain-0", "call-0"))
+
+    dispatcher.set_subscribed(channel, False)
+    dispatcher.submit(channel, ("chain-1", "call-1"))
+    assert list(channel.pending) == [("chain-1", "call-1")]
+
+    dispatcher.set_subscribed(channel, True)
+    dispatcher.submit(channel, ("chain-2", "call-2"))
+    dispatcher.close()
+    assert writer.written == _events(0, 3)
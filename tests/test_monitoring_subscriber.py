@@ -0,0 +1,88 @@
+"""
+Tests for MonitoringSubscriber's bounded, indexed event storage.
+
+Events are fed straight into the subscriber's receive handler; the DDS reader
+it creates is not exercised.
+"""
+
+import itertools
+
+import pytest
+
+pytest.importorskip("rti.connextdds")
+
+from genesis_lib import genesis_monitoring
+from genesis_lib.genesis_monitoring import MonitoringSubscriber
+
+_EVENT_TYPES = ("0", "1", "2")
+_ENTITY_TYPES = ("0", "1")
+
+
+@pytest.fixture
+def subscriber(monkeypatch):
+    monkeypatch.setattr(genesis_monitoring, "EVENT_HISTORY_SIZE", 50)
+    subscriber = MonitoringSubscriber()
+    yield subscriber
+    subscriber.close()
+
+
+def _receive(subscriber, count, event_types=_EVENT_TYPES, entity_types=_ENTITY_TYPES, start=0):
+    pairs = itertools.islice(
+        zip(itertools.cycle(event_types), itertools.cycle(entity_types)), count)
+    for n, (event_type, entity_type) in enumerate(pairs, start):
+        subscriber._on_event_received({
+            "event_id": f"event-{n}",
+            "timestamp": n,
+            "event_type": event_type,
+            "entity_type": entity_type,
+            "entity_id": "entity",
+            "metadata": "",
+            "call_data": "",
+            "result_data": "",
+            "status_data": "",
+        })
+
+
+def _scan(subscriber, event_type=None, entity_type=None):
+    """The result get_events must match: a filtered scan of the full history."""
+    return [
+        e for e in subscriber.get_events()
+        if (not event_type or e["event_type"] == event_type)
+        and (not entity_type or e["entity_type"] == entity_type)
+    ]
+
+
+def _assert_queries_agree(subscriber):
+    for event_type in (None,) + _EVENT_TYPES:
+        for entity_type in (None,) + _ENTITY_TYPES:
+            expected = _scan(subscriber, event_type, entity_type)
+            assert subscriber.get_events(event_type=event_type, entity_type=entity_type) == expected
+            assert subscriber.get_events(max_count=3, event_type=event_type, entity_type=entity_type) == expected[-3:]
+
+
+def test_history_is_bounded(subscriber):
+    _receive(subscriber, 120)
+    events = subscriber.get_events()
+    assert len(events) == 50
+    assert [e["event_id"] for e in events] == [f"event-{n}" for n in range(70, 120)]
+
+
+def test_filtered_and_unfiltered_queries_agree_after_eviction(subscriber):
+    _receive(subscriber, 120)
+    _assert_queries_agree(subscriber)
+
+
+def test_rare_event_type_is_dropped_with_the_history(subscriber):
+    _receive(subscriber, 5, event_types=("9",))
+    _receive(subscriber, 60, start=5)
+    assert subscriber.get_events(event_type="9") == []
+    _assert_queries_agree(subscriber)
+
+
+def test_clear_events(subscriber):
+    _receive(subscriber, 30)
+    subscriber.clear_events()
+    assert subscriber.get_events() == []
+    assert subscriber.get_events(event_type="0") == []
+    _receive(subscriber, 10, start=30)
+    _assert_queries_agree(subscriber)